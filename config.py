@@ -3,7 +3,8 @@
 # ============================================================
 
 # Pesos relativos de cada criterio en el cálculo del ICI v7.
-# Deben coincidir con la fórmula utilizada en evaluador_v7.py.
+# evaluador_v7.py los importa directamente (única fuente de verdad);
+# el orden de las claves es el orden del vector de puntajes.
 PESOS_CRITERIOS = {
     "C1": 0.15,  # Pluralidad de indicios
     "C2": 0.15,  # Fiabilidad de las fuentes
@@ -16,6 +17,33 @@ PESOS_CRITERIOS = {
 }
 
 
+# Avisos por criterio especialmente bajo: (criterio, umbral, mensaje).
+# Tener los umbrales en una tabla evita la cadena de ifs paralelos y
+# deja a la vista, en un solo lugar, qué se considera "bajo".
+UMBRALES_AVISOS = [
+    ("C1", 30,
+     "C1 muy bajo: la estructura probatoria es monocéntrica o descansa "
+     "en muy pocos indicios relevantes."),
+    ("C4", 40,
+     "C4 bajo: no se desarrollan ni se descartan adecuadamente hipótesis alternativas "
+     "exculpatorias, lo que afecta la presunción de inocencia en su dimensión metodológica."),
+    ("C5", 40,
+     "C5 muy bajo: existen imprecisiones o incoherencias temporales/espaciales que "
+     "dificultan reconstruir con claridad la secuencia de hechos imputados."),
+    ("C6", 60,
+     "C6 bajo: se detectan posibles círculos viciosos en el uso de la prueba "
+     "(especialmente en pericias psicológicas o valoraciones que asumen como probado "
+     "lo que deberían demostrar)."),
+    ("C7", 50,
+     "C7 bajo: la motivación global presenta saltos lógicos, omisiones o contradicciones "
+     "que afectan la coherencia del razonamiento."),
+    ("C13", 40,
+     "C13 muy bajo: no se aprecia corroboración independiente relevante; la estructura "
+     "probatoria depende casi exclusivamente de una única fuente (por ejemplo, la declaración "
+     "de la víctima), lo que incrementa considerablemente el riesgo de error judicial."),
+]
+
+
 def interpretar_ici(ici: float, criterios: dict) -> str:
     """
     Devuelve una interpretación textual del valor del ICI v7.
@@ -45,50 +73,11 @@ def interpretar_ici(ici: float, criterios: dict) -> str:
             "con estándares razonables de coherencia y justificación."
         )
 
-    avisos = []
-
-    # Pluralidad de indicios muy baja
-    if criterios.get("C1", 100) < 30:
-        avisos.append(
-            "C1 muy bajo: la estructura probatoria es monocéntrica o descansa "
-            "en muy pocos indicios relevantes."
-        )
-
-    # Hipótesis alternativas mal tratadas
-    if criterios.get("C4", 100) < 40:
-        avisos.append(
-            "C4 bajo: no se desarrollan ni se descartan adecuadamente hipótesis alternativas "
-            "exculpatorias, lo que afecta la presunción de inocencia en su dimensión metodológica."
-        )
-
-    # Coherencia temporal / espacial muy débil
-    if criterios.get("C5", 100) < 40:
-        avisos.append(
-            "C5 muy bajo: existen imprecisiones o incoherencias temporales/espaciales que "
-            "dificultan reconstruir con claridad la secuencia de hechos imputados."
-        )
-
-    # Circularidad o motivación global deficiente
-    if criterios.get("C6", 100) < 60:
-        avisos.append(
-            "C6 bajo: se detectan posibles círculos viciosos en el uso de la prueba "
-            "(especialmente en pericias psicológicas o valoraciones que asumen como probado "
-            "lo que deberían demostrar)."
-        )
-
-    if criterios.get("C7", 100) < 50:
-        avisos.append(
-            "C7 bajo: la motivación global presenta saltos lógicos, omisiones o contradicciones "
-            "que afectan la coherencia del razonamiento."
-        )
-
-    # Falta de corroboración independiente
-    if criterios.get("C13", 100) < 40:
-        avisos.append(
-            "C13 muy bajo: no se aprecia corroboración independiente relevante; la estructura "
-            "probatoria depende casi exclusivamente de una única fuente (por ejemplo, la declaración "
-            "de la víctima), lo que incrementa considerablemente el riesgo de error judicial."
-        )
+    avisos = [
+        mensaje
+        for criterio, umbral, mensaje in UMBRALES_AVISOS
+        if criterios.get(criterio, 100) < umbral
+    ]
 
     if avisos:
         return base + " " + " ".join(avisos)
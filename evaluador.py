@@ -6,6 +6,15 @@ from typing import Dict, Any
 from evaluador_v7 import calcular_ici_v7 as motor_ici_v7
 from config import interpretar_ici
 
+# Frenos de emergencia por criterio: (criterio, umbral, etiqueta, detalle).
+UMBRALES_FRENOS = [
+    ("C4", 40, "Hipótesis alternativas débiles",
+     "C4 muy bajo: no se analizan ni descartan adecuadamente "
+     "hipótesis alternativas exculpatorias."),
+    ("C13", 40, "Sin corroboración independiente",
+     "C13 muy bajo: casi no hay evidencia independiente que respalde la tesis condenatoria."),
+]
+
 
 def calcular_ici_v7(texto: str) -> Dict[str, Any]:
     base = motor_ici_v7(texto) or {}
@@ -21,18 +30,11 @@ def calcular_ici_v7(texto: str) -> Dict[str, Any]:
 
     interpretacion = interpretar_ici(ici_ajustado, criterios)
 
-    frenos = {}
-
-    if criterios.get("C4", 100) < 40:
-        frenos["Hipótesis alternativas débiles"] = (
-            "C4 muy bajo: no se analizan ni descartan adecuadamente "
-            "hipótesis alternativas exculpatorias."
-        )
-
-    if criterios.get("C13", 100) < 40:
-        frenos["Sin corroboración independiente"] = (
-            "C13 muy bajo: casi no hay evidencia independiente que respalde la tesis condenatoria."
-        )
+    frenos = {
+        etiqueta: detalle
+        for criterio, umbral, etiqueta, detalle in UMBRALES_FRENOS
+        if criterios.get(criterio, 100) < umbral
+    }
 
     if ici_ajustado < 40:
         frenos["ICI muy bajo"] = (
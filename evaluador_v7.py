@@ -1,248 +1,460 @@
-# ============================================================
-#  ACRJ – ICI v7
-#  evaluador_v7.py
-#  Sistema de Auditoría de Coherencia Razonativa Judicial
-# ============================================================
-
-import re
-
-# ------------------------------------------------------------
-# C1 – PLURALIDAD DE INDICIOS
-# ------------------------------------------------------------
-def evaluar_C1(texto: str) -> float:
-    t = texto.lower()
-
-    grupos = {
-        "testigos": [r"testigo", r"declaraci[oó]n testimonial"],
-        "pericias": [r"pericia", r"peritaje"],
-        "documentos": [r"documento", r"oficio", r"contrato"],
-        "actas": [r"acta", r"intervenci[oó]n"],
-        "videos": [r"video", r"grabaci[oó]n"],
-        "registros": [r"registro", r"bit[aá]cora"],
-    }
-
-    tipos = 0
-    for patrones in grupos.values():
-        if any(re.search(p, t) for p in patrones):
-            tipos += 1
-
-    if tipos == 0:
-        return 10
-    elif tipos == 1:
-        return 40
-    elif tipos == 2:
-        return 60
-    elif tipos == 3:
-        return 75
-    else:
-        return 90
-
-
-# ------------------------------------------------------------
-# C2 – FIABILIDAD DE LAS FUENTES
-# ------------------------------------------------------------
-def evaluar_C2(texto: str) -> float:
-    t = texto.lower()
-    puntaje = 20
-
-    if "persist" in t:
-        puntaje += 20
-    if "coheren" in t:
-        puntaje += 20
-    if "veros" in t:
-        puntaje += 20
-    if "corroborad" in t:
-        puntaje += 20
-    if "contradicci" in t:
-        puntaje += 10  
-
-    return min(puntaje, 100)
-
-
-# ------------------------------------------------------------
-# C3 – NEXO LÓGICO
-# ------------------------------------------------------------
-def evaluar_C3(texto: str) -> float:
-    conectores = [
-        "por tanto", "por consiguiente", "en consecuencia",
-        "se colige", "se desprende", "de ello se concluye"
-    ]
-
-    t = texto.lower()
-    coincidencias = sum(1 for c in conectores if c in t)
-
-    if coincidencias == 0:
-        return 30
-    elif coincidencias == 1:
-        return 55
-    elif coincidencias == 2:
-        return 70
-    elif coincidencias == 3:
-        return 80
-    else:
-        return 90
-
-
-# ------------------------------------------------------------
-# C4 – HIPÓTESIS ALTERNATIVAS
-# ------------------------------------------------------------
-def evaluar_C4(texto: str) -> float:
-    t = texto.lower()
-
-    menciona = re.search(
-        r"hip[oó]tesis alternativa|versi[oó]n exculpatoria|"
-        r"otra explicaci[oó]n|error de identificaci[oó]n|defensa del imputado",
-        t
-    )
-
-    analiza = re.search(
-        r"se analiza la versi[oó]n del imputado|se contrasta con la versi[oó]n de la defensa|"
-        r"se descarta la hip[oó]tesis",
-        t
-    )
-
-    if not menciona:
-        return 20  
-    elif menciona and not analiza:
-        return 40  
-    else:
-        return 75  
-
-
-# ------------------------------------------------------------
-# C5 – COHERENCIA TEMPORAL / ESPACIAL
-# ------------------------------------------------------------
-def evaluar_C5(texto: str) -> float:
-    t = texto.lower()
-
-    fechas = re.findall(r"(19|20)\d{2}", t)
-    secuencia = re.findall(
-        r"primera ocasi[oó]n|segunda|tercera|posteriormente|con anterioridad|despu[eé]s",
-        t
-    )
-
-    if not fechas and not secuencia:
-        return 30
-    elif len(fechas) <= 2 and len(secuencia) <= 2:
-        return 55
-    elif len(fechas) >= 3 and len(secuencia) >= 2:
-        return 70
-    else:
-        return 80
-
-
-# ------------------------------------------------------------
-# C6 – AUSENCIA DE CIRCULARIDAD
-# ------------------------------------------------------------
-def evaluar_C6(texto: str) -> float:
-    t = texto.lower()
-
-    circular = re.search(
-        r"pericia psicol[oó]gica.*agresi[oó]n sexual vivida|"
-        r"impacto emocional.*demuestra la agresi[oó]n",
-        t
-    )
-
-    if circular:
-        return 60
-    else:
-        return 80
-
-
-# ------------------------------------------------------------
-# C7 – MOTIVACIÓN GLOBAL
-# ------------------------------------------------------------
-def evaluar_C7(texto: str) -> float:
-    t = texto.lower()
-
-    secciones = 0
-    patrones = [
-        "considerando", "fundamento", "motivaci", "an[aá]lisis de la prueba"
-    ]
-
-    for p in patrones:
-        if p in t:
-            secciones += 1
-
-    if secciones == 0:
-        return 30
-    elif secciones == 1:
-        return 50
-    elif secciones == 2:
-        return 65
-    elif secciones == 3:
-        return 75
-    else:
-        return 85
-
-
-# ------------------------------------------------------------
-# C13 – CORROBORACIÓN INDEPENDIENTE (CRITERIO NUEVO)
-# ------------------------------------------------------------
-def evaluar_C13(texto: str) -> float:
-    t = texto.lower()
-
-    evidencias = [
-        "certificado médico", "certificado médico legal", "examen médico",
-        "pericia de adn", "huella dactilar", "huellas dactilares",
-        "cámara de seguridad", "video", "grabación de audio",
-        "registro telefónico", "whatsapp", "mensaje de texto",
-        "acta de intervención", "acta de registro",
-        "acta de incautación", "documento bancario",
-        "estado de cuenta", "movimiento bancario",
-        "pericia balística", "reconocimiento fotográfico",
-        "reconocimiento en rueda",
-    ]
-
-    testigos = [
-        "testigo presencial", "presenció directamente", "vio cuando", "observó cuando"
-    ]
-
-    total = 0
-
-    for palabra in evidencias:
-        if palabra in t:
-            total += 1
-    for frase in testigos:
-        if frase in t:
-            total += 1
-
-    if total == 0:
-        return 10
-    elif total == 1:
-        return 40
-    elif 2 <= total <= 3:
-        return 70
-    else:
-        return 90
-
-
-# ------------------------------------------------------------
-# CÁLCULO DEL ÍNDICE FINAL – ICI v7
-# ------------------------------------------------------------
-def calcular_ici_v7(texto: str) -> dict:
-    C1 = evaluar_C1(texto)
-    C2 = evaluar_C2(texto)
-    C3 = evaluar_C3(texto)
-    C4 = evaluar_C4(texto)
-    C5 = evaluar_C5(texto)
-    C6 = evaluar_C6(texto)
-    C7 = evaluar_C7(texto)
-    C13 = evaluar_C13(texto)
-
-    ICI_v7 = (
-        0.15 * C1 +
-        0.15 * C2 +
-        0.15 * C3 +
-        0.20 * C4 +
-        0.10 * C5 +
-        0.10 * C6 +
-        0.05 * C7 +
-        0.10 * C13
-    )
-
-    return {
-        "C1": C1, "C2": C2, "C3": C3, "C4": C4,
-        "C5": C5, "C6": C6, "C7": C7, "C13": C13,
-        "ICI_v7": ICI_v7
-    }
+# ============================================================
+#  ACRJ – ICI v7
+#  evaluador_v7.py
+#  Sistema de Auditoría de Coherencia Razonativa Judicial
+# ============================================================
+
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from config import PESOS_CRITERIOS
+
+# Única fuente de verdad de los pesos: el vector sigue el orden de
+# inserción del dict (C1, C2, C3, C4, C5, C6, C7, C13), que es el mismo
+# orden en que _puntuar_criterios arma el vector de puntajes.
+_PESOS = np.fromiter(PESOS_CRITERIOS.values(), dtype=np.float64)
+
+# pyahocorasick permite buscar todos los términos literales de C13 en una
+# única pasada O(N) sobre el texto; si no está instalado se usa la
+# alternancia compilada como respaldo.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# numba compila las escalas de puntaje y la suma ponderada a código
+# nativo; sin numba se ejecutan tal cual en Python puro.
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# ------------------------------------------------------------
+# Pasada maestra sobre el texto
+# ------------------------------------------------------------
+# Los patrones de C1–C5 y C7 se funden en UNA alternancia con un grupo
+# nombrado por término: calcular_ici_v7 recorre el texto una sola vez y
+# reparte cada coincidencia al criterio correspondiente, en lugar de una
+# pasada completa por criterio. C13 se resuelve aparte con su autómata
+# (más abajo) y C6 mantiene su búsqueda propia porque sus patrones
+# abarcan tramos largos (".*") que se tragarían coincidencias de otros
+# criterios.
+#
+# Cada entrada es (patrón, etiquetas) y cada etiqueta es
+# (criterio, categoría):
+#   - C1/C3/C7: la categoría identifica el grupo o conector
+#     (se cuentan categorías distintas);
+#   - C2: la palabra clave ("contradicci" pesa distinto);
+#   - C4: "menciona" / "analiza" (banderas);
+#   - C5: "fechas" / "secuencia" (se cuentan ocurrencias).
+# Un mismo término puede acreditar varias etiquetas; la variante
+# combinada de C4 va explícita para que "se descarta la hipótesis
+# alternativa" cuente también como mención.
+_TERMINOS_MAESTRO = [
+    # C1 – pluralidad de indicios
+    (r"testigo", (("C1", "testigos"),)),
+    (r"declaraci[oó]n testimonial", (("C1", "testigos"),)),
+    (r"pericia", (("C1", "pericias"),)),
+    (r"peritaje", (("C1", "pericias"),)),
+    (r"documento", (("C1", "documentos"),)),
+    (r"oficio", (("C1", "documentos"),)),
+    (r"contrato", (("C1", "documentos"),)),
+    (r"acta", (("C1", "actas"),)),
+    (r"intervenci[oó]n", (("C1", "actas"),)),
+    (r"video", (("C1", "videos"),)),
+    (r"grabaci[oó]n", (("C1", "videos"),)),
+    (r"registro", (("C1", "registros"),)),
+    (r"bit[aá]cora", (("C1", "registros"),)),
+    # C2 – fiabilidad de las fuentes
+    (r"persist", (("C2", "persist"),)),
+    (r"coheren", (("C2", "coheren"),)),
+    (r"veros", (("C2", "veros"),)),
+    (r"corroborad", (("C2", "corroborad"),)),
+    (r"contradicci", (("C2", "contradicci"),)),
+    # C3 – nexo lógico
+    (r"por tanto", (("C3", "por_tanto"),)),
+    (r"por consiguiente", (("C3", "por_consiguiente"),)),
+    (r"en consecuencia", (("C3", "en_consecuencia"),)),
+    (r"se colige", (("C3", "se_colige"),)),
+    (r"se desprende", (("C3", "se_desprende"),)),
+    (r"de ello se concluye", (("C3", "se_concluye"),)),
+    # C4 – hipótesis alternativas
+    (r"hip[oó]tesis alternativa", (("C4", "menciona"),)),
+    (r"versi[oó]n exculpatoria", (("C4", "menciona"),)),
+    (r"otra explicaci[oó]n", (("C4", "menciona"),)),
+    (r"error de identificaci[oó]n", (("C4", "menciona"),)),
+    (r"defensa del imputado", (("C4", "menciona"),)),
+    (r"se analiza la versi[oó]n del imputado", (("C4", "analiza"),)),
+    (r"se contrasta con la versi[oó]n de la defensa", (("C4", "analiza"),)),
+    (r"se descarta la hip[oó]tesis alternativa",
+     (("C4", "analiza"), ("C4", "menciona"))),
+    (r"se descarta la hip[oó]tesis", (("C4", "analiza"),)),
+    # C5 – coherencia temporal / espacial
+    (r"(?:19|20)\d{2}", (("C5", "fechas"),)),
+    (r"primera ocasi[oó]n", (("C5", "secuencia"),)),
+    (r"segunda", (("C5", "secuencia"),)),
+    (r"tercera", (("C5", "secuencia"),)),
+    (r"posteriormente", (("C5", "secuencia"),)),
+    (r"con anterioridad", (("C5", "secuencia"),)),
+    (r"despu[eé]s", (("C5", "secuencia"),)),
+    # C7 – motivación global
+    (r"considerando", (("C7", "considerando"),)),
+    (r"fundamento", (("C7", "fundamento"),)),
+    (r"motivaci", (("C7", "motivacion"),)),
+    (r"an[aá]lisis de la prueba", (("C7", "analisis"),)),
+]
+
+# Los patrones más largos van primero para que la alternancia capture la
+# variante más específica cuando varias comparten inicio.
+_ORDEN_MAESTRO = sorted(
+    range(len(_TERMINOS_MAESTRO)),
+    key=lambda i: -len(_TERMINOS_MAESTRO[i][0]),
+)
+
+_MAESTRO_RE = re.compile(
+    "|".join(f"(?P<g{i}>{_TERMINOS_MAESTRO[i][0]})" for i in _ORDEN_MAESTRO)
+)
+
+_ETIQUETAS_MAESTRO = {
+    f"g{i}": etiquetas for i, (_, etiquetas) in enumerate(_TERMINOS_MAESTRO)
+}
+
+_C6_CIRCULAR_RE = re.compile(
+    r"pericia psicol[oó]gica.*agresi[oó]n sexual vivida|"
+    r"impacto emocional.*demuestra la agresi[oó]n"
+)
+
+# C13: términos literales ordenados de mayor a menor longitud para que
+# la alternancia capture primero la variante más específica.
+_C13_TERMINOS = [
+    "certificado médico", "certificado médico legal", "examen médico",
+    "pericia de adn", "huella dactilar", "huellas dactilares",
+    "cámara de seguridad", "video", "grabación de audio",
+    "registro telefónico", "whatsapp", "mensaje de texto",
+    "acta de intervención", "acta de registro",
+    "acta de incautación", "documento bancario",
+    "estado de cuenta", "movimiento bancario",
+    "pericia balística", "reconocimiento fotográfico",
+    "reconocimiento en rueda",
+    # Testigos directos
+    "testigo presencial", "presenció directamente", "vio cuando", "observó cuando",
+]
+
+# Respaldo sin pyahocorasick: los términos son frases de 1 a 3 palabras,
+# así que basta tokenizar el texto una vez y cruzar el frozenset de
+# términos con los n-gramas (1..3) por pertenencia hash: O(N) de
+# tokenización + O(K) de consultas, en vez de K recorridos del texto.
+_C13_TERMS = frozenset(_C13_TERMINOS)
+
+_C13_PALABRA_RE = re.compile(r"\w+")
+
+if ahocorasick is not None:
+    _C13_AUTOMATA = ahocorasick.Automaton()
+    for _termino in _C13_TERMINOS:
+        _C13_AUTOMATA.add_word(_termino, _termino)
+    _C13_AUTOMATA.make_automaton()
+else:
+    _C13_AUTOMATA = None
+
+
+def _escanear(texto: str) -> dict:
+    """
+    Recorre el texto UNA sola vez con la alternancia maestra y devuelve
+    los agregados que necesita cada criterio.
+    """
+    agregados = {
+        "C1": set(), "C2": set(), "C3": set(), "C7": set(),
+        "C4_menciona": False, "C4_analiza": False,
+        "C5_fechas": 0, "C5_secuencia": 0,
+    }
+
+    for m in _MAESTRO_RE.finditer(texto):
+        for criterio, categoria in _ETIQUETAS_MAESTRO[m.lastgroup]:
+            if criterio == "C4":
+                agregados["C4_" + categoria] = True
+            elif criterio == "C5":
+                # La escala de C5 solo distingue 0, ≤2 y ≥3: el contador
+                # se satura en 3 y no crece más en textos largos.
+                clave = "C5_" + categoria
+                if agregados[clave] < 3:
+                    agregados[clave] += 1
+            else:
+                agregados[criterio].add(categoria)
+
+    return agregados
+
+
+# ------------------------------------------------------------
+# Escalas de puntaje por criterio
+# ------------------------------------------------------------
+
+def _puntaje_C1(tipos: int) -> float:
+    if tipos == 0:
+        return 10.0
+    elif tipos == 1:
+        return 40.0
+    elif tipos == 2:
+        return 60.0
+    elif tipos == 3:
+        return 75.0
+    else:
+        return 90.0
+
+
+def _puntaje_C2(fiables: int, contradiccion: bool) -> float:
+    puntaje = 20 + 20 * fiables
+    if contradiccion:
+        puntaje += 10
+
+    return float(min(puntaje, 100))
+
+
+def _puntaje_C3(coincidencias: int) -> float:
+    if coincidencias == 0:
+        return 30.0
+    elif coincidencias == 1:
+        return 55.0
+    elif coincidencias == 2:
+        return 70.0
+    elif coincidencias == 3:
+        return 80.0
+    else:
+        return 90.0
+
+
+def _puntaje_C4(menciona: bool, analiza: bool) -> float:
+    if not menciona:
+        return 20.0
+    elif menciona and not analiza:
+        return 40.0
+    else:
+        return 75.0
+
+
+def _puntaje_C5(fechas: int, secuencia: int) -> float:
+    if fechas == 0 and secuencia == 0:
+        return 30.0
+    elif fechas <= 2 and secuencia <= 2:
+        return 55.0
+    elif fechas >= 3 and secuencia >= 2:
+        return 70.0
+    else:
+        return 80.0
+
+
+def _puntaje_C6(circular: bool) -> float:
+    if circular:
+        return 60.0
+    else:
+        return 80.0
+
+
+def _puntaje_C7(secciones: int) -> float:
+    if secciones == 0:
+        return 30.0
+    elif secciones == 1:
+        return 50.0
+    elif secciones == 2:
+        return 65.0
+    elif secciones == 3:
+        return 75.0
+    else:
+        return 85.0
+
+
+def _puntaje_C13(total: int) -> float:
+    if total == 0:
+        return 10.0
+    elif total == 1:
+        return 40.0
+    elif 2 <= total <= 3:
+        return 70.0
+    else:
+        return 90.0
+
+
+def _puntuar_criterios(contadores):
+    """
+    Aplica todas las escalas sobre el vector de conteos y devuelve
+    (C1, C2, C3, C4, C5, C6, C7, C13, ICI_v7).
+
+    El vector (int64) es: [tipos C1, fuentes fiables C2, contradicción
+    C2, conectores C3, menciona C4, analiza C4, fechas C5, secuencia C5,
+    circularidad C6, secciones C7, términos C13].
+    """
+    C1 = _puntaje_C1(contadores[0])
+    C2 = _puntaje_C2(contadores[1], contadores[2] != 0)
+    C3 = _puntaje_C3(contadores[3])
+    C4 = _puntaje_C4(contadores[4] != 0, contadores[5] != 0)
+    C5 = _puntaje_C5(contadores[6], contadores[7])
+    C6 = _puntaje_C6(contadores[8] != 0)
+    C7 = _puntaje_C7(contadores[9])
+    C13 = _puntaje_C13(contadores[10])
+
+    puntajes = np.empty(8, dtype=np.float64)
+    puntajes[0] = C1
+    puntajes[1] = C2
+    puntajes[2] = C3
+    puntajes[3] = C4
+    puntajes[4] = C5
+    puntajes[5] = C6
+    puntajes[6] = C7
+    puntajes[7] = C13
+
+    # Producto punto explícito: np.dot bajo numba exige la BLAS de
+    # scipy; el bucle compila a lo mismo para 8 elementos.
+    ICI_v7 = 0.0
+    for i in range(8):
+        ICI_v7 += _PESOS[i] * puntajes[i]
+
+    return (C1, C2, C3, C4, C5, C6, C7, C13, ICI_v7)
+
+
+if numba is not None:
+    _puntaje_C1 = numba.njit(cache=True)(_puntaje_C1)
+    _puntaje_C2 = numba.njit(cache=True)(_puntaje_C2)
+    _puntaje_C3 = numba.njit(cache=True)(_puntaje_C3)
+    _puntaje_C4 = numba.njit(cache=True)(_puntaje_C4)
+    _puntaje_C5 = numba.njit(cache=True)(_puntaje_C5)
+    _puntaje_C6 = numba.njit(cache=True)(_puntaje_C6)
+    _puntaje_C7 = numba.njit(cache=True)(_puntaje_C7)
+    _puntaje_C13 = numba.njit(cache=True)(_puntaje_C13)
+    _puntuar_criterios = numba.njit(cache=True)(_puntuar_criterios)
+    # Compilación anticipada: el costo del JIT se paga al importar y no
+    # en la primera evaluación.
+    _puntuar_criterios(np.zeros(11, dtype=np.int64))
+
+
+# ------------------------------------------------------------
+# Evaluadores individuales (C1 – C13)
+# ------------------------------------------------------------
+# Se mantienen como API pública; cada uno lanza su propia pasada, así
+# que para evaluar todos los criterios conviene usar calcular_ici_v7,
+# que comparte una única pasada maestra.
+
+def evaluar_C1(texto: str) -> float:
+    # Salida temprana: con 4 tipos de indicio la escala ya está en su
+    # tope (90), no hace falta seguir recorriendo el texto.
+    tipos = set()
+    for m in _MAESTRO_RE.finditer(texto):
+        for criterio, categoria in _ETIQUETAS_MAESTRO[m.lastgroup]:
+            if criterio == "C1":
+                tipos.add(categoria)
+        if len(tipos) >= 4:
+            break
+
+    return _puntaje_C1(len(tipos))
+
+
+def evaluar_C2(texto: str) -> float:
+    # Con 4 fuentes fiables el puntaje ya alcanza el máximo (100) con o
+    # sin contradicción, así que se corta el recorrido en ese punto.
+    hits = set()
+    fiables = 0
+    for m in _MAESTRO_RE.finditer(texto):
+        for criterio, categoria in _ETIQUETAS_MAESTRO[m.lastgroup]:
+            if criterio == "C2" and categoria not in hits:
+                hits.add(categoria)
+                if categoria != "contradicci":
+                    fiables += 1
+        if fiables >= 4:
+            break
+
+    return _puntaje_C2(fiables, "contradicci" in hits)
+
+
+def evaluar_C3(texto: str) -> float:
+    return _puntaje_C3(len(_escanear(texto)["C3"]))
+
+
+def evaluar_C4(texto: str) -> float:
+    agregados = _escanear(texto)
+    return _puntaje_C4(agregados["C4_menciona"], agregados["C4_analiza"])
+
+
+def evaluar_C5(texto: str) -> float:
+    agregados = _escanear(texto)
+    return _puntaje_C5(agregados["C5_fechas"], agregados["C5_secuencia"])
+
+
+def evaluar_C6(texto: str) -> float:
+    return _puntaje_C6(bool(_C6_CIRCULAR_RE.search(texto)))
+
+
+def evaluar_C7(texto: str) -> float:
+    return _puntaje_C7(len(_escanear(texto)["C7"]))
+
+
+def _contar_C13(texto: str) -> int:
+    if _C13_AUTOMATA is not None:
+        return len({termino for _, termino in _C13_AUTOMATA.iter(texto)})
+
+    palabras = _C13_PALABRA_RE.findall(texto)
+    ngramas = set(palabras)
+    ngramas.update(
+        f"{palabras[i]} {palabras[i + 1]}" for i in range(len(palabras) - 1)
+    )
+    ngramas.update(
+        f"{palabras[i]} {palabras[i + 1]} {palabras[i + 2]}"
+        for i in range(len(palabras) - 2)
+    )
+
+    return len(_C13_TERMS & ngramas)
+
+
+def evaluar_C13(texto: str) -> float:
+    return _puntaje_C13(_contar_C13(texto))
+
+
+# ------------------------------------------------------------
+# CÁLCULO DEL ÍNDICE FINAL – ICI v7
+# ------------------------------------------------------------
+# Por debajo de este tamaño el costo de armar el pool supera lo que se
+# gana solapando las tres pasadas; las sentencias típicas quedan fuera.
+_UMBRAL_PARALELO = 200_000
+
+
+def calcular_ici_v7(texto: str) -> dict:
+    # Una sola copia en minúsculas compartida por todos los evaluadores,
+    # en lugar de un texto.lower() por criterio.
+    t = texto.lower()
+
+    # Tras la fusión quedan tres pasadas independientes sobre el texto:
+    # la maestra, la de circularidad (C6) y la de corroboración (C13).
+    # En textos muy largos se lanzan en paralelo; en el resto, en serie.
+    if len(t) >= _UMBRAL_PARALELO:
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futuro_maestro = pool.submit(_escanear, t)
+            futuro_c6 = pool.submit(_C6_CIRCULAR_RE.search, t)
+            futuro_c13 = pool.submit(_contar_C13, t)
+        agregados = futuro_maestro.result()
+        circular = futuro_c6.result() is not None
+        terminos_c13 = futuro_c13.result()
+    else:
+        agregados = _escanear(t)
+        circular = _C6_CIRCULAR_RE.search(t) is not None
+        terminos_c13 = _contar_C13(t)
+
+    contadores = np.array([
+        len(agregados["C1"]),
+        len(agregados["C2"] - {"contradicci"}),
+        int("contradicci" in agregados["C2"]),
+        len(agregados["C3"]),
+        int(agregados["C4_menciona"]),
+        int(agregados["C4_analiza"]),
+        agregados["C5_fechas"],
+        agregados["C5_secuencia"],
+        int(circular),
+        len(agregados["C7"]),
+        terminos_c13,
+    ], dtype=np.int64)
+
+    C1, C2, C3, C4, C5, C6, C7, C13, ICI_v7 = _puntuar_criterios(contadores)
+
+    return {
+        "C1": C1, "C2": C2, "C3": C3, "C4": C4,
+        "C5": C5, "C6": C6, "C7": C7, "C13": C13,
+        "ICI_v7": ICI_v7
+    }
@@ -1,51 +1,138 @@
-# ============================================================
-#  extractores.py – Versión optimizada para ACRJ–ICI v7
-#  Compatible con Streamlit Cloud (NO usa pdfplumber)
-# ============================================================
-
-import re
-from typing import Optional
-from docx import Document
-import PyPDF2
-
-
-def limpiar_texto(texto: Optional[str]) -> str:
-    """
-    Limpia el texto antes de procesarlo.
-    - Elimina saltos de línea múltiples.
-    - Normaliza espacios.
-    - Devuelve texto ordenado.
-    """
-    if not texto:
-        return ""
-
-    texto = re.sub(r"\r\n", "\n", texto)
-    texto = re.sub(r"\n{3,}", "\n\n", texto)
-    texto = re.sub(r"[ \t]{2,}", " ", texto)
-
-    return texto.strip()
-
-
-def leer_pdf(archivo) -> str:
-    """
-    Lee un PDF usando PyPDF2 (compatible con Streamlit Cloud).
-    Extrae texto básico sin requerir dependencias externas.
-    """
-    texto_total = []
-
-    lector = PyPDF2.PdfReader(archivo)
-    for pagina in lector.pages:
-        contenido = pagina.extract_text() or ""
-        texto_total.append(contenido)
-
-    return "\n\n".join(texto_total)
-
-
-def leer_word(archivo) -> str:
-    """
-    Lee archivos .docx usando python-docx.
-    Devuelve el texto concatenado.
-    """
-    doc = Document(archivo)
-    partes = [p.text for p in doc.paragraphs if p.text.strip()]
-    return "\n\n".join(partes)
+# ============================================================
+#  extractores.py – Versión optimizada para ACRJ–ICI v7
+#  Compatible con Streamlit Cloud (NO usa pdfplumber)
+# ============================================================
+
+import re
+import zipfile
+from io import StringIO
+from typing import Optional
+
+# PyPDF2, python-docx, lxml y pypdfium2 se importan dentro de las
+# funciones que los usan: en el arranque en frío de Streamlit esos
+# imports dominan el tiempo hasta el primer render, y si el usuario pega
+# texto en lugar de subir un archivo nunca hacen falta. Python cachea el
+# módulo, así que las llamadas siguientes no pagan nada.
+
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+# Limpieza en UNA sola pasada: la alternancia cubre los tres casos que
+# antes se resolvían con tres re.sub secuenciales (tres recorridos y tres
+# copias del texto completo). La rama de saltos múltiples acepta \r\n para
+# que la normalización CRLF no necesite una pasada previa.
+_RE_LIMPIEZA = re.compile(r"(?P<nl>(?:\r\n|\n){3,})|(?P<crlf>\r\n)|(?P<sp>[ \t]{2,})")
+
+
+def _reemplazo_limpieza(m: "re.Match") -> str:
+    if m.lastgroup == "nl":
+        return "\n\n"
+    if m.lastgroup == "crlf":
+        return "\n"
+    return " "
+
+
+def limpiar_texto(texto: Optional[str]) -> str:
+    """
+    Limpia el texto antes de procesarlo.
+    - Elimina saltos de línea múltiples.
+    - Normaliza espacios.
+    - Devuelve texto ordenado.
+    """
+    if not texto:
+        return ""
+
+    return _RE_LIMPIEZA.sub(_reemplazo_limpieza, texto).strip()
+
+
+def leer_pdf(archivo) -> str:
+    """
+    Lee un PDF usando pypdfium2 cuando está disponible (mucho más rápido)
+    y PyPDF2 como respaldo compatible con Streamlit Cloud.
+    """
+    # pypdfium2 (motor C de PDFium) extrae texto un orden de magnitud
+    # más rápido que PyPDF2; si no está instalado en el despliegue se
+    # usa PyPDF2, compatible con cualquier entorno.
+    try:
+        import pypdfium2  # noqa: F401
+    except ImportError:
+        return _leer_pdf_pypdf2(archivo)
+    return _leer_pdf_pdfium(archivo)
+
+
+def _leer_pdf_pdfium(archivo) -> str:
+    import pypdfium2 as pdfium
+
+    buffer = StringIO()
+
+    documento = pdfium.PdfDocument(archivo)
+    try:
+        for i, pagina in enumerate(documento):
+            if i:
+                buffer.write("\n\n")
+            buffer.write(pagina.get_textpage().get_text_range() or "")
+    finally:
+        documento.close()
+
+    return buffer.getvalue()
+
+
+def _leer_pdf_pypdf2(archivo) -> str:
+    import PyPDF2
+
+    # Se escribe página a página en un único buffer en lugar de retener
+    # todas las páginas en una lista y concatenarlas al final: en PDFs
+    # grandes eso duplicaba el pico de memoria.
+    buffer = StringIO()
+
+    lector = PyPDF2.PdfReader(archivo)
+    for i, pagina in enumerate(lector.pages):
+        if i:
+            buffer.write("\n\n")
+        buffer.write(pagina.extract_text() or "")
+
+    return buffer.getvalue()
+
+
+def leer_word(archivo) -> str:
+    """
+    Lee archivos .docx.
+
+    La vía rápida extrae word/document.xml del ZIP y recorre los nodos
+    <w:t> directamente con lxml, sin construir el árbol de objetos de
+    python-docx (que domina el costo en documentos largos). Si el
+    archivo no tiene la estructura esperada se recurre a python-docx.
+    """
+    from lxml import etree
+
+    try:
+        return _leer_word_xml(archivo)
+    except (zipfile.BadZipFile, KeyError, etree.XMLSyntaxError):
+        if hasattr(archivo, "seek"):
+            archivo.seek(0)
+        return _leer_word_docx(archivo)
+
+
+def _leer_word_xml(archivo) -> str:
+    from lxml import etree
+
+    with zipfile.ZipFile(archivo) as zf:
+        raiz = etree.fromstring(zf.read("word/document.xml"))
+
+    partes = []
+    for parrafo in raiz.iter(_W_NS + "p"):
+        texto = "".join(t.text or "" for t in parrafo.iter(_W_NS + "t"))
+        if texto.strip():
+            partes.append(texto)
+
+    return "\n\n".join(partes)
+
+
+def _leer_word_docx(archivo) -> str:
+    from docx import Document
+
+    doc = Document(archivo)
+    # Una sola lectura de .text por párrafo (antes se leía dos veces:
+    # en el filtro y en la lista).
+    return "\n\n".join(
+        texto for texto in (p.text for p in doc.paragraphs) if texto.strip()
+    )
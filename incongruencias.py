@@ -1,861 +1,1357 @@
-"""
-Módulo A – Detector objetivo de incongruencias lógicas y normativas
-en resoluciones que usan razonamiento indiciario.
-
-Incluye:
-- Reglas generales (duda vs certeza, sospecha, etc.)
-- REGLAS 1 a 9 sobre método indiciario.
-
-Este módulo es independiente del cálculo del ICI (v6 o v7):
-solo necesita el TEXTO de la resolución y devuelve una lista
-de posibles incongruencias con extractos y tipo de problema.
-"""
-
-import re
-from typing import List, Dict, Any
-
-# -------------------
-# 1. Segmentación y utilidades
-# -------------------
-
-def segmentar_parrafos(texto: str) -> List[Dict[str, Any]]:
-    """
-    Divide el texto en "párrafos" usando doble salto de línea.
-    Devuelve una lista de dicts: {"n": número, "texto": contenido}.
-    """
-    bloques = re.split(r"\n\s*\n", texto)
-    parrafos = []
-    for i, bloque in enumerate(bloques, start=1):
-        limpio = bloque.strip()
-        if limpio:
-            parrafos.append({"n": i, "texto": limpio})
-    return parrafos
-
-
-def recortar_texto(texto: str, max_len: int = 280) -> str:
-    """
-    Recorta texto para mostrar como extracto breve.
-    Sustituye saltos de línea por espacios.
-    """
-    t = texto.strip().replace("\n", " ")
-    if len(t) <= max_len:
-        return t
-    return t[: max_len - 3] + "..."
-
-
-# -------------------
-# 2. Patrones globales
-# -------------------
-
-# Duda probatoria
-PATRON_DUDA = re.compile(
-    r"(no existe prueba suficiente|no se ha acreditado|no se ha demostrado|"
-    r"no se ha probado|no se cuenta con prueba suficiente|no hay elementos suficientes)",
-    flags=re.IGNORECASE,
-)
-
-# Certeza / acreditación plena
-PATRON_CERTEZA = re.compile(
-    r"(ha quedado acreditado|se encuentra plenamente probado|"
-    r"plena certeza|se ha demostrado de manera fehaciente|"
-    r"plenamente demostrado)",
-    flags=re.IGNORECASE,
-)
-
-# Hipótesis alternativas no descartadas
-PATRON_NO_DESCARTA_ALT = re.compile(
-    r"(no se descartan otras versiones|no se descartan otras hipótesis|"
-    r"no puede descartarse|no puede excluirse|no se ha descartado la versión del imputado)",
-    flags=re.IGNORECASE,
-)
-
-# Única explicación / única conclusión
-PATRON_UNICA_EXPLICACION = re.compile(
-    r"(única explicación posible|única explicación razonable|"
-    r"única conclusión posible|la única hipótesis plausible|"
-    r"la única explicación atendible)",
-    flags=re.IGNORECASE,
-)
-
-# Estándar de sospecha
-PATRON_SOSPECHA_SIMPLE = re.compile(
-    r"(sospecha simple|mera sospecha|sospecha inicial)",
-    flags=re.IGNORECASE,
-)
-
-PATRON_SOSPECHA_GRAVE = re.compile(
-    r"(sospecha grave|sospecha reveladora)",
-    flags=re.IGNORECASE,
-)
-
-# ---------- PATRONES ESPECÍFICOS PARA INDICIOS (REGLA 1) ----------
-
-PATRON_INDICIO = re.compile(
-    r"\bindicio\b|\bindicios\b|\bhecho indiciario\b|\bhechos indiciarios\b|\bhecho base\b",
-    flags=re.IGNORECASE,
-)
-
-PATRON_FUENTE_FUERTE = re.compile(
-    r"\bpericia\b|\binforme pericial\b|\bperito\b|\binforme t[eé]cnico\b|\bdictamen\b|\bpericia oficial\b",
-    flags=re.IGNORECASE,
-)
-
-PATRON_FUENTE_DEBIL = re.compile(
-    r"\btestigo\b|\bdeclaraci[oó]n\b|\bmanifestaci[oó]n\b|\bversi[oó]n del imputado\b",
-    flags=re.IGNORECASE,
-)
-
-PATRON_CONJUNTO = re.compile(
-    r"(en su conjunto|considerados en su conjunto|"
-    r"valorados en conjunto|en forma conjunta|en conjunto permiten concluir|"
-    r"indicios convergentes|coherentes entre s[ií])",
-    flags=re.IGNORECASE,
-)
-
-# ---------- REGLA 2 – Evaluación del indicio ----------
-
-PATRON_EVAL_DEBIL_INDICIO = re.compile(
-    r"((indicio|prueba|elemento|medio de prueba).{0,80}"
-    r"(no es concluyente|no resulta concluyente|no es determinante|no es suficiente|"
-    r"es d[eé]bil|tiene escaso valor|poca fuerza acreditativa|no permite afirmar|"
-    r"solo sugiere|aporta poco|limitado alcance probatorio))",
-    flags=re.IGNORECASE | re.DOTALL,
-)
-
-PATRON_EVAL_FUERTE_INDICIO = re.compile(
-    r"((indicio|prueba|elemento|medio de prueba).{0,80}"
-    r"(es contundente|resulta contundente|es concluyente|resulta concluyente|"
-    r"es determinante|resulta determinante|es rotundo|inequ[ií]voco|"
-    r"de singular fuerza acreditativa|permite afirmar sin duda|"
-    r"permite tener por cierto|permite tener por plenamente acreditado))",
-    flags=re.IGNORECASE | re.DOTALL,
-)
-
-
-# -------------------
-# 3. Etiquetado de párrafos
-# -------------------
-
-def etiquetar_parrafos(parrafos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """
-    Añade etiquetas booleanas a cada párrafo según los patrones detectados.
-    """
-    etiquetados = []
-    for p in parrafos:
-        t = p["texto"]
-        etiquetados.append(
-            {
-                "n": p["n"],
-                "texto": t,
-                "duda": bool(PATRON_DUDA.search(t)),
-                "certeza": bool(PATRON_CERTEZA.search(t)),
-                "no_descarta_alt": bool(PATRON_NO_DESCARTA_ALT.search(t)),
-                "unica_explicacion": bool(PATRON_UNICA_EXPLICACION.search(t)),
-                "sospecha_simple": bool(PATRON_SOSPECHA_SIMPLE.search(t)),
-                "sospecha_grave": bool(PATRON_SOSPECHA_GRAVE.search(t)),
-                # Método indiciario:
-                "tiene_indicio": bool(PATRON_INDICIO.search(t)),
-                "fuente_fuerte": bool(PATRON_FUENTE_FUERTE.search(t)),
-                "fuente_debil": bool(PATRON_FUENTE_DEBIL.search(t)),
-                # Evaluación del indicio:
-                "eval_ind_debil": bool(PATRON_EVAL_DEBIL_INDICIO.search(t)),
-                "eval_ind_fuerte": bool(PATRON_EVAL_FUERTE_INDICIO.search(t)),
-            }
-        )
-    return etiquetados
-
-
-# -------------------
-# 4. Reglas de incongruencia
-# -------------------
-
-def detectar_incongruencias(parrafos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """
-    Aplica las REGLAS 0–9 y devuelve una lista de posibles incongruencias,
-    cada una con:
-    - tipo
-    - párrafos involucrados
-    - detalle
-    - extractos (fragmentos de texto)
-    """
-    resultados: List[Dict[str, Any]] = []
-
-    texto_global = " ".join(p["texto"] for p in parrafos)
-
-    con_duda = [p for p in parrafos if p["duda"]]
-    con_certeza = [p for p in parrafos if p["certeza"]]
-    con_no_descarta = [p for p in parrafos if p["no_descarta_alt"]]
-    con_unica = [p for p in parrafos if p["unica_explicacion"]]
-    con_sospecha_simple = [p for p in parrafos if p["sospecha_simple"]]
-    con_sospecha_grave = [p for p in parrafos if p["sospecha_grave"]]
-    con_indicio = [p for p in parrafos if p["tiene_indicio"]]
-    con_eval_debil = [p for p in parrafos if p["eval_ind_debil"]]
-    con_eval_fuerte = [p for p in parrafos if p["eval_ind_fuerte"]]
-
-    # --------------------------------------------------
-    # 4.0 Reglas generales (duda vs certeza, sospecha)
-    # --------------------------------------------------
-
-    # 4.0.1 Contradicción duda vs certeza
-    if con_duda and con_certeza:
-        max_pares = 3
-        count = 0
-        for pd in con_duda:
-            for pc in con_certeza:
-                if count >= max_pares:
-                    break
-                resultados.append(
-                    {
-                        "tipo": "Contradicción duda vs certeza",
-                        "parrafos": [pd["n"], pc["n"]],
-                        "detalle": (
-                            "En un párrafo se afirma insuficiencia probatoria y en otro certeza plena, "
-                            "sin justificar la transición."
-                        ),
-                        "extractos": [
-                            recortar_texto(pd["texto"]),
-                            recortar_texto(pc["texto"]),
-                        ],
-                    }
-                )
-                count += 1
-            if count >= max_pares:
-                break
-
-    # 4.0.2 Incongruencia en hipótesis alternativas
-    if con_no_descarta and con_unica:
-        max_pares = 3
-        count = 0
-        for pa in con_no_descarta:
-            for pu in con_unica:
-                if count >= max_pares:
-                    break
-                resultados.append(
-                    {
-                        "tipo": "Incongruencia en hipótesis alternativas",
-                        "parrafos": [pa["n"], pu["n"]],
-                        "detalle": (
-                            "Se afirma que no se descartan hipótesis alternativas, "
-                            "pero a la vez se sostiene que existe una única explicación."
-                        ),
-                        "extractos": [
-                            recortar_texto(pa["texto"]),
-                            recortar_texto(pu["texto"]),
-                        ],
-                    }
-                )
-                count += 1
-            if count >= max_pares:
-                break
-
-    # 4.0.3 Referencia a sospecha simple
-    if con_sospecha_simple:
-        for ps in con_sospecha_simple:
-            resultados.append(
-                {
-                    "tipo": "Referencia a 'sospecha simple' o equivalente",
-                    "parrafos": [ps["n"]],
-                    "detalle": (
-                        "Se menciona 'sospecha simple' o equivalente; debe verificarse su compatibilidad "
-                        "con el estándar exigido en la resolución (p. ej., prisión preventiva)."
-                    ),
-                    "extractos": [recortar_texto(ps["texto"])],
-                }
-            )
-
-    # 4.0.4 Tensión entre sospecha simple y grave
-    if con_sospecha_simple and con_sospecha_grave:
-        resultados.append(
-            {
-                "tipo": "Tensión entre 'sospecha simple' y 'sospecha grave'",
-                "parrafos": [p["n"] for p in con_sospecha_simple + con_sospecha_grave],
-                "detalle": (
-                    "En distintos párrafos se menciona tanto 'sospecha simple' "
-                    "como 'sospecha grave', lo que exige clarificación del estándar aplicado."
-                ),
-                "extractos": [
-                    recortar_texto(p["texto"]) for p in con_sospecha_simple + con_sospecha_grave
-                ],
-            }
-        )
-
-    # ============================================================
-    #  REGLA 1 – Pluralidad y convergencia de indicios
-    # ============================================================
-
-    parrafos_con_indicio = con_indicio
-
-    # 1.1 Ausencia total de referencia a indicios
-    if len(parrafos_con_indicio) == 0 and parrafos:
-        resultados.append({
-            "tipo": "Ausencia de referencia explícita a indicios o hechos indiciarios",
-            "parrafos": [p["n"] for p in parrafos[:3]],
-            "detalle": (
-                "No se identifican menciones a indicios o hechos indiciarios, pese a tratarse "
-                "de una resolución que pretende utilizar razonamiento indiciario."
-            ),
-            "extractos": [recortar_texto(p["texto"]) for p in parrafos[:3]],
-        })
-
-    # 1.2 Indicio único débil
-    if len(parrafos_con_indicio) == 1:
-        unico = parrafos_con_indicio[0]
-        if unico["fuente_debil"] and not unico["fuente_fuerte"]:
-            resultados.append({
-                "tipo": "Indicio único sin singular fuerza acreditativa",
-                "parrafos": [unico["n"]],
-                "detalle": (
-                    "El único indicio identificado proviene de fuente testimonial débil y "
-                    "se presenta como suficiente, vulnerando el método indiciario."
-                ),
-                "extractos": [recortar_texto(unico["texto"])],
-            })
-
-    # 1.3 Pluralidad sin convergencia
-    if len(parrafos_con_indicio) >= 2:
-        hay_convergencia = bool(PATRON_CONJUNTO.search(texto_global))
-        if not hay_convergencia:
-            resultados.append({
-                "tipo": "Pluralidad de indicios sin explicación de convergencia/interrelación",
-                "parrafos": [p["n"] for p in parrafos_con_indicio],
-                "detalle": (
-                    "Existen varios indicios pero sin valoración conjunta o convergente."
-                ),
-                "extractos": [recortar_texto(p["texto"]) for p in parrafos_con_indicio[:4]],
-            })
-
-    # ============================================================
-    #  REGLA 2 – Consistencia interna del indicio
-    # ============================================================
-
-    # 2.1 mismo párrafo: fuerte + débil
-    for p in parrafos:
-        if p["eval_ind_debil"] and p["eval_ind_fuerte"]:
-            resultados.append({
-                "tipo": "Valoración interna contradictoria del indicio (mismo párrafo)",
-                "parrafos": [p["n"]],
-                "detalle": (
-                    "En un mismo párrafo se califica un indicio como débil y fuerte a la vez."
-                ),
-                "extractos": [recortar_texto(p["texto"])],
-            })
-
-    # 2.2 entre párrafos distintos
-    if con_eval_debil and con_eval_fuerte:
-        max_pares = 3
-        count = 0
-        for pd in con_eval_debil:
-            for pf in con_eval_fuerte:
-                if pd["n"] == pf["n"]:
-                    continue
-                if count >= max_pares:
-                    break
-                resultados.append({
-                    "tipo": "Evaluación contradictoria del indicio (párrafos distintos)",
-                    "parrafos": [pd["n"], pf["n"]],
-                    "detalle": (
-                        "En un párrafo se describe un indicio como débil y en otro como fuerte o concluyente."
-                    ),
-                    "extractos": [recortar_texto(pd["texto"]), recortar_texto(pf["texto"])],
-                })
-                count += 1
-            if count >= max_pares:
-                break
-
-    # ============================================================
-    #  REGLA 3 – Consistencia externa entre indicios
-    # ============================================================
-
-    PATRON_CONTRADICCION_INDICIOS = re.compile(
-        r"(no coincide con|contradice|incompatible con|no guarda relaci[oó]n|"
-        r"no se relaciona|resulta incompatible|es inconsistente con|se opone a|discrepa)",
-        flags=re.IGNORECASE,
-    )
-
-    for p in parrafos_con_indicio:
-        if PATRON_CONTRADICCION_INDICIOS.search(p["texto"]):
-            resultados.append({
-                "tipo": "Contradicción explícita entre indicios",
-                "parrafos": [p["n"]],
-                "detalle": "Se explicita incompatibilidad entre indicios o hechos indiciarios.",
-                "extractos": [recortar_texto(p["texto"])],
-            })
-
-    patron_conexion = re.compile(
-        r"(relaci[oó]n l[oó]gica|conexi[oó]n|v[ií]nculo|enlace|coherencia externa|armoniza)",
-        flags=re.IGNORECASE,
-    )
-
-    if len(parrafos_con_indicio) >= 2 and not patron_conexion.search(texto_global):
-        resultados.append({
-            "tipo": "Falta de conexión entre indicios (consistencia externa)",
-            "parrafos": [p["n"] for p in parrafos_con_indicio],
-            "detalle": "Los indicios no aparecen conectados ni articulados entre sí.",
-            "extractos": [recortar_texto(p["texto"]) for p in parrafos_con_indicio[:4]],
-        })
-
-    # ============================================================
-    #  REGLA 4 – Saltos lógicos típicos
-    # ============================================================
-
-    patron_presencia = re.compile(
-        r"(por el solo hecho de encontrarse|por el solo hecho de estar|basta la presencia|por estar en el lugar)",
-        flags=re.IGNORECASE,
-    )
-    patron_conocimiento_r4 = re.compile(
-        r"(deb[ií]a conocer|sab[ií]a|no pod[ií]a ignorar|ten[ií]a conocimiento)",
-        flags=re.IGNORECASE,
-    )
-
-    for p in parrafos:
-        texto_p = p["texto"]
-        if patron_presencia.search(texto_p) and patron_conocimiento_r4.search(texto_p):
-            resultados.append({
-                "tipo": "Salto presencia física → conocimiento/participación",
-                "parrafos": [p["n"]],
-                "detalle": "Se infiere conocimiento o participación solo desde la presencia física.",
-                "extractos": [recortar_texto(texto_p)],
-            })
-
-    patron_cargo = re.compile(
-        r"(por su calidad de|en su condici[oó]n de|en su calidad de|por su cargo de)",
-        flags=re.IGNORECASE,
-    )
-    patron_responsab = re.compile(
-        r"(es responsable|dirig[ií]a|orden[oó]|autoriz[oó]|dispuso|ten[ií]a dominio del hecho)",
-        flags=re.IGNORECASE,
-    )
-
-    for p in parrafos:
-        texto_p = p["texto"]
-        if patron_cargo.search(texto_p) and patron_responsab.search(texto_p):
-            resultados.append({
-                "tipo": "Salto de cargo/jerarquía → autoría/responsabilidad penal",
-                "parrafos": [p["n"]],
-                "detalle": "Se deduce autoría o responsabilidad penal solo por el cargo.",
-                "extractos": [recortar_texto(texto_p)],
-            })
-
-    patron_conclusion_fuerte = re.compile(
-        r"(es evidente que|resulta evidente que|no cabe duda de que|"
-        r"resulta incuestionable que|es indudable que)",
-        flags=re.IGNORECASE,
-    )
-    patron_referencia_prueba = re.compile(
-        r"(prueba|pruebas|indicio|indicios|hecho indiciario|hechos indiciarios|"
-        r"pericia|perito|informe pericial|informe t[eé]cnico|"
-        r"testigo|testigos|declaraci[oó]n|declaraciones|acta|actas|informe)",
-        flags=re.IGNORECASE,
-    )
-
-    for p in parrafos:
-        texto_p = p["texto"]
-        if patron_conclusion_fuerte.search(texto_p) and not patron_referencia_prueba.search(texto_p):
-            resultados.append(
-                {
-                    "tipo": "Conclusión categórica sin referencia explícita a prueba/indicios",
-                    "parrafos": [p["n"]],
-                    "detalle": (
-                        "Se formulan conclusiones categóricas sin mencionar pruebas o indicios de soporte."
-                    ),
-                    "extractos": [recortar_texto(texto_p)],
-                }
-            )
-
-    # ============================================================
-    #  REGLA 5 – Uso indebido de testimoniales
-    # ============================================================
-
-    patron_testimonio = re.compile(
-        r"(testigo|declaraci[oó]n|manifestaci[oó]n|versi[oó]n del imputado)",
-        flags=re.IGNORECASE,
-    )
-    patron_fuerza_indebida = re.compile(
-        r"(indicio contundente|prueba concluyente|prueba determinante|"
-        r"prueba inequ[ií]voca|permite tener por acreditado|"
-        r"demuestra claramente|acredita fehacientemente)",
-        flags=re.IGNORECASE,
-    )
-
-    for p in parrafos:
-        texto_p = p["texto"]
-        if patron_testimonio.search(texto_p) and patron_fuerza_indebida.search(texto_p):
-            resultados.append({
-                "tipo": "Uso indebido de testimonial como indicio fuerte",
-                "parrafos": [p["n"]],
-                "detalle": (
-                    "Una fuente testimonial es presentada como prueba concluyente o contundente."
-                ),
-                "extractos": [recortar_texto(texto_p)],
-            })
-
-    patron_autoria = re.compile(
-        r"(particip[oó]|coordin[oó]|dirigi[oó]|orden[oó]|autoriz[oó]|"
-        r"ten[ií]a dominio del hecho|responsable del hecho)",
-        flags=re.IGNORECASE,
-    )
-
-    for p in parrafos:
-        texto_p = p["texto"]
-        if patron_testimonio.search(texto_p) and patron_autoria.search(texto_p):
-            resultados.append({
-                "tipo": "Salto testimonial → autoría/responsabilidad",
-                "parrafos": [p["n"]],
-                "detalle": (
-                    "Una declaración testimonial se utiliza para afirmar participación o autoría "
-                    "sin puente indiciario objetivo."
-                ),
-                "extractos": [recortar_texto(texto_p)],
-            })
-
-    if len(parrafos_con_indicio) == 1:
-        unico = parrafos_con_indicio[0]
-        if unico["fuente_debil"] and patron_fuerza_indebida.search(unico["texto"]):
-            resultados.append(
-                {
-                    "tipo": "Indicio único testimonial tratado como prueba fuerte",
-                    "parrafos": [unico["n"]],
-                    "detalle": (
-                        "El único indicio, de fuente testimonial, es tratado como prueba contundente."
-                    ),
-                    "extractos": [recortar_texto(unico["texto"])],
-                }
-            )
-
-    # ============================================================
-    #  REGLA 6 – Cadena inferencial incompleta
-    # ============================================================
-
-    patron_conclusion = re.compile(
-        r"(por tanto|por ende|en consecuencia|por consiguiente|"
-        r"se concluye que|queda acreditado que|resulta acreditado que|"
-        r"resulta probado que|se tiene por probado que)",
-        flags=re.IGNORECASE,
-    )
-
-    patron_sustento = re.compile(
-        r"(prueba|pruebas|indicio|indicios|hecho indiciario|hechos indiciarios|"
-        r"pericia|perito|acta|informe|testigo|declaraci[oó]n|documento)",
-        flags=re.IGNORECASE,
-    )
-
-    patron_causalidad = re.compile(
-        r"(lo cual demuestra que|esto demuestra que|ello demuestra que|"
-        r"lo que prueba que|esto evidencia que|ello evidencia que|"
-        r"lo que acredita que)",
-        flags=re.IGNORECASE,
-    )
-
-    for p in parrafos:
-        texto_p = p["texto"]
-        if patron_conclusion.search(texto_p) and not patron_sustento.search(texto_p):
-            resultados.append({
-                "tipo": "Conclusión sin sustento indiciario previo",
-                "parrafos": [p["n"]],
-                "detalle": (
-                    "Se formula una conclusión fuerte sin integrar pruebas o indicios en el propio razonamiento."
-                ),
-                "extractos": [recortar_texto(texto_p)],
-            })
-
-        if patron_causalidad.search(texto_p) and not patron_sustento.search(texto_p):
-            resultados.append(
-                {
-                    "tipo": "Afirmación causal sin explicación del vínculo (salto lógico)",
-                    "parrafos": [p["n"]],
-                    "detalle": (
-                        "Se afirma que algo 'demuestra' o 'evidencia' un hecho sin explicitar "
-                        "el vínculo entre los hechos y la conclusión."
-                    ),
-                    "extractos": [recortar_texto(texto_p)],
-                }
-            )
-
-    patron_autoria_coord = re.compile(
-        r"(coordin[oó]|dirigi[oó]|organiz[oó]|autoriz[oó]|"
-        r"dispuso|control[oó]|ten[ií]a dominio del hecho)",
-        flags=re.IGNORECASE,
-    )
-
-    patron_conocimiento = re.compile(
-        r"(sab[ií]a que|ten[ií]a conocimiento de|no pod[ií]a ignorar|"
-        r"deb[ií]a conocer|pleno conocimiento de)",
-        flags=re.IGNORECASE,
-    )
-
-    for p in parrafos:
-        texto_p = p["texto"]
-        if patron_autoria_coord.search(texto_p) and not patron_sustento.search(texto_p):
-            resultados.append(
-                {
-                    "tipo": "Afirmación de coordinación/autoría sin sustento indiciario",
-                    "parrafos": [p["n"]],
-                    "detalle": (
-                        "Se afirma coordinación, dirección u organización sin integrar indicios concretos."
-                    ),
-                    "extractos": [recortar_texto(texto_p)],
-                }
-            )
-
-        if patron_conocimiento.search(texto_p) and not patron_sustento.search(texto_p):
-            resultados.append(
-                {
-                    "tipo": "Afirmación de conocimiento sin sustento probatorio",
-                    "parrafos": [p["n"]],
-                    "detalle": (
-                        "Se afirma que el imputado 'sabía' o 'debía conocer' sin identificar el indicio que lo acredita."
-                    ),
-                    "extractos": [recortar_texto(texto_p)],
-                }
-            )
-
-    # ============================================================
-    #  REGLA 7 – Valoración contraria al contenido expreso de la prueba
-    # ============================================================
-
-    patron_medio_probatorio = re.compile(
-        r"(declaraci[oó]n de|declar[oó] que|manifiest[oó] que|seg[uú]n el acta|"
-        r"seg[uú]n consta en el acta|acta policial|acta fiscal|informe pericial|"
-        r"informe t[eé]cnico|pericia oficial|pericia practicada|seg[uú]n el informe)",
-        flags=re.IGNORECASE,
-    )
-
-    patron_contenido_negativo = re.compile(
-        r"(no recuerda|no reconoci[oó]|no vio|no observ[oó]|no estuvo presente|"
-        r"no le consta|no puede precisar|no puede afirmar|no se aprecia|"
-        r"no se advierte|no se demuestra|no se acredita)",
-        flags=re.IGNORECASE,
-    )
-
-    patron_conclusion_fuerte_prueba = re.compile(
-        r"(de lo que se desprende que|de ello se desprende que|lo que demuestra que|"
-        r"lo que acredita que|ello demuestra que|ello acredita que|"
-        r"permite tener por acreditado que|confirma que|"
-        r"demuestra claramente que|acredita de manera concluyente que)",
-        flags=re.IGNORECASE,
-    )
-
-    for p in parrafos:
-        texto_p = p["texto"]
-        if (
-            patron_medio_probatorio.search(texto_p)
-            and patron_contenido_negativo.search(texto_p)
-            and patron_conclusion_fuerte_prueba.search(texto_p)
-        ):
-            resultados.append(
-                {
-                    "tipo": "Valoración contraria al contenido expreso del medio probatorio (mismo párrafo)",
-                    "parrafos": [p["n"]],
-                    "detalle": (
-                        "Se presenta un medio probatorio como demostrativo cuando el propio texto "
-                        "reconoce que su contenido es negativo o dubitativo."
-                    ),
-                    "extractos": [recortar_texto(texto_p)],
-                }
-            )
-
-    # ============================================================
-    #  REGLA 8 – Hipótesis alternativas mal tratadas
-    # ============================================================
-
-    patron_alt_existencia = re.compile(
-        r"(otras versiones|otras explicaciones|otras hipótesis|"
-        r"hip[oó]tesis alternativa|versi[oó]n alternativa|"
-        r"coartada|explicaci[oó]n del imputado|"
-        r"otra posible explicaci[oó]n)",
-        flags=re.IGNORECASE,
-    )
-
-    patron_no_descarta_alt2 = re.compile(
-        r"(no se descartan|no puede descartarse|no puede excluirse|"
-        r"no se ha descartado|no excluye la versi[oó]n del imputado)",
-        flags=re.IGNORECASE,
-    )
-
-    patron_unica_conclusion = re.compile(
-        r"(única explicaci[oó]n posible|única explicaci[oó]n razonable|"
-        r"única conclusi[oó]n posible|única hip[oó]tesis plausible|"
-        r"único camino l[oó]gico|conclusi[oó]n inevitable)",
-        flags=re.IGNORECASE,
-    )
-
-    patron_descartar_sin_exp = re.compile(
-        r"(no es cre[ií]ble|no resulta razonable|no convence al juzgador|"
-        r"no es atendible|resulta inveros[ií]mil|no tiene asidero)",
-        flags=re.IGNORECASE,
-    )
-
-    patron_analisis_alt = re.compile(
-        r"(analiza la versi[oó]n alternativa|contrasta la hip[oó]tesis|"
-        r"examina la explicaci[oó]n del imputado|"
-        r"eval[uú]a la versi[oó]n alternativa)",
-        flags=re.IGNORECASE,
-    )
-
-    for p in parrafos:
-        texto_p = p["texto"]
-        if patron_alt_existencia.search(texto_p) and patron_unica_conclusion.search(texto_p):
-            resultados.append(
-                {
-                    "tipo": "Incongruencia: reconoce alternativas pero afirma única explicación",
-                    "parrafos": [p["n"]],
-                    "detalle": (
-                        "Se reconocen hipótesis alternativas pero se mantiene una 'única explicación' como definitiva."
-                    ),
-                    "extractos": [recortar_texto(texto_p)],
-                }
-            )
-
-        if patron_no_descarta_alt2.search(texto_p) and patron_unica_conclusion.search(texto_p):
-            resultados.append(
-                {
-                    "tipo": "No se descartan alternativas pero se afirma conclusión única",
-                    "parrafos": [p["n"]],
-                    "detalle": (
-                        "Se admite que no se descartan otras hipótesis y aun así se afirma una única conclusión."
-                    ),
-                    "extractos": [recortar_texto(texto_p)],
-                }
-            )
-
-        if patron_alt_existencia.search(texto_p) and not patron_analisis_alt.search(texto_p):
-            resultados.append(
-                {
-                    "tipo": "Mención de hipótesis alternativas sin análisis",
-                    "parrafos": [p["n"]],
-                    "detalle": (
-                        "Se mencionan explicaciones alternativas sin analizarlas ni contrastarlas."
-                    ),
-                    "extractos": [recortar_texto(texto_p)],
-                }
-            )
-
-        if patron_alt_existencia.search(texto_p) and patron_descartar_sin_exp.search(texto_p):
-            resultados.append(
-                {
-                    "tipo": "Descarte injustificado de hipótesis alternativa",
-                    "parrafos": [p["n"]],
-                    "detalle": (
-                        "Se descarta una versión alternativa con fórmulas vacías ('no es creíble', etc.) "
-                        "sin justificación probatoria."
-                    ),
-                    "extractos": [recortar_texto(texto_p)],
-                }
-            )
-
-        if patron_unica_conclusion.search(texto_p) and not patron_alt_existencia.search(texto_p):
-            resultados.append(
-                {
-                    "tipo": "Conclusión única sin contrastar hipótesis alternativas",
-                    "parrafos": [p["n"]],
-                    "detalle": (
-                        "Se sostiene una 'única explicación' sin referencia a posibles hipótesis alternativas."
-                    ),
-                    "extractos": [recortar_texto(texto_p)],
-                }
-            )
-
-    # ============================================================
-    #  REGLA 9 – Máximas de experiencia y sana crítica mal aplicadas
-    # ============================================================
-
-    patron_max_exp = re.compile(
-        r"(m[aá]ximas de la experiencia|reglas de experiencia|"
-        r"reglas de la experiencia com[uú]n|m[aá]ximas de experiencia com[uú]n)",
-        flags=re.IGNORECASE,
-    )
-
-    patron_sana_critica = re.compile(
-        r"(sana cr[ií]tica|reglas de la sana cr[ií]tica|"
-        r"principios de la sana cr[ií]tica)",
-        flags=re.IGNORECASE,
-    )
-
-    patron_generalizacion = re.compile(
-        r"(lo normal es que|lo habitual es que|"
-        r"es de experiencia com[uú]n que|"
-        r"es de conocimiento general que|"
-        r"suele ocurrir que|es l[oó]gico pensar que|"
-        r"es natural que)",
-        flags=re.IGNORECASE,
-    )
-
-    patron_estereotipo = re.compile(
-        r"(quien nada debe nada teme|nadie inocente huye|"
-        r"quien huye es porque algo teme|"
-        r"todo narcotraficante|todo delincuente|"
-        r"ninguna persona honesta|ning[uú]n inocente)",
-        flags=re.IGNORECASE,
-    )
-
-    patron_sustento_exp = re.compile(
-        r"(prueba|pruebas|indicio|indicios|hecho indiciario|hechos indiciarios|"
-        r"pericia|perito|informe pericial|informe t[eé]cnico|"
-        r"estudio estad[ií]stico|estad[ií]sticas|datos emp[ií]ricos|"
-        r"acta|actas|documento|documentaci[oó]n)",
-        flags=re.IGNORECASE,
-    )
-
-    for p in parrafos:
-        texto_p = p["texto"]
-        if (patron_max_exp.search(texto_p) or patron_sana_critica.search(texto_p)) and not patron_sustento_exp.search(texto_p):
-            resultados.append(
-                {
-                    "tipo": "Invocación abstracta de máximas de experiencia/sana crítica sin explicación",
-                    "parrafos": [p["n"]],
-                    "detalle": (
-                        "Se invocan genéricamente máximas de experiencia o sana crítica sin explicarlas "
-                        "ni vincularlas con datos empíricos ni pruebas."
-                    ),
-                    "extractos": [recortar_texto(texto_p)],
-                }
-            )
-
-        if patron_generalizacion.search(texto_p) and not patron_sustento_exp.search(texto_p):
-            resultados.append(
-                {
-                    "tipo": "Generalización empírica sin sustento probatorio",
-                    "parrafos": [p["n"]],
-                    "detalle": (
-                        "Se usan fórmulas como 'lo normal es que', 'es de experiencia común que', "
-                        "sin apoyo en datos empíricos o pruebas específicas."
-                    ),
-                    "extractos": [recortar_texto(texto_p)],
-                }
-            )
-
-        if patron_estereotipo.search(texto_p):
-            resultados.append(
-                {
-                    "tipo": "Uso de máximas de experiencia estereotipadas/prejuiciosas",
-                    "parrafos": [p["n"]],
-                    "detalle": (
-                        "Se utilizan estereotipos ('quien nada debe nada teme', etc.) como si fueran "
-                        "verdaderas máximas de experiencia."
-                    ),
-                    "extractos": [recortar_texto(texto_p)],
-                }
-            )
-
-    return resultados
-
-
-# -------------------
-# 5. Función principal para la app
-# -------------------
-
-def analizar_incongruencias(texto: str, resultados: Dict[str, Any] = None) -> List[Dict[str, Any]]:
-    """
-    Función principal llamada por la app de Streamlit.
-
-    - texto: sentencia completa (obligatorio)
-    - resultados: dict devuelto por el evaluador (opcional, por ahora no se usa)
-
-    Devuelve una lista de dicts con las incongruencias detectadas.
-    """
-    if not texto or not texto.strip():
-        return []
-
-    parrafos = segmentar_parrafos(texto)
-    parrafos_etq = etiquetar_parrafos(parrafos)
-    return detectar_incongruencias(parrafos_etq)
+"""
+Módulo A – Detector objetivo de incongruencias lógicas y normativas
+en resoluciones que usan razonamiento indiciario.
+
+Incluye:
+- Reglas generales (duda vs certeza, sospecha, etc.)
+- REGLAS 1 a 9 sobre método indiciario.
+
+Este módulo es independiente del cálculo del ICI (v6 o v7):
+solo necesita el TEXTO de la resolución y devuelve una lista
+de posibles incongruencias con extractos y tipo de problema.
+"""
+
+import hashlib
+import os
+import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import chain
+from typing import List, Dict, Any
+
+import numpy as np
+
+# pyahocorasick recorre todos los términos literales del etiquetado en
+# una única pasada O(N) por párrafo; si no está instalado se usa la
+# alternancia compilada como respaldo.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# numba compila la emisión de pares de párrafos contradictorios a
+# código nativo; sin numba se ejecuta tal cual en Python puro.
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# RE2 (pyre2) ejecuta las alternancias con un DFA en tiempo lineal
+# garantizado, sin retroceso; su API es compatible con re. No soporta
+# los lookahead de ancho cero del etiquetado, así que cada patrón se
+# intenta con RE2 y cae al motor siguiente si lo rechaza (o si pyre2
+# no está instalado).
+try:
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+
+# El módulo regex (API compatible con re) sí acepta los lookahead y en
+# las alternancias largas de este archivo resulta bastante más rápido
+# que re; es el segundo escalón antes de caer al re estándar.
+try:
+    import regex as _regex
+except ImportError:
+    _regex = None
+
+
+def _compilar(patron: str, flags: int = 0):
+    if _re2 is not None:
+        try:
+            return _re2.compile(patron, flags)
+        except Exception:
+            pass
+    if _regex is not None:
+        return _regex.compile(patron, flags)
+    return re.compile(patron, flags)
+
+# -------------------
+# 1. Segmentación y utilidades
+# -------------------
+
+def segmentar_parrafos(texto: str) -> List[Dict[str, Any]]:
+    """
+    Divide el texto en "párrafos" usando doble salto de línea.
+    Devuelve una lista de dicts: {"n": número, "texto": contenido}.
+
+    Se recorren las líneas acumulando hasta encontrar una corrida de
+    líneas en blanco (el equivalente del separador "\\n\\s*\\n"), sin
+    pasar el motor de regex por todo el documento. Los bloques vacíos
+    se descartan pero siguen contando para la numeración, igual que con
+    re.split.
+    """
+    parrafos = []
+    actual: List[str] = []
+    n = 1
+
+    def _cerrar(num: int) -> None:
+        limpio = "\n".join(actual).strip()
+        if limpio:
+            parrafos.append({"n": num, "texto": limpio})
+        actual.clear()
+
+    blancos = 0
+    for linea in texto.split("\n"):
+        if linea.strip():
+            # Una corrida interna de líneas en blanco siempre separa; al
+            # comienzo del texto hacen falta dos (una sola línea en
+            # blanco inicial no contiene los dos "\n" del separador).
+            if blancos and (actual or parrafos or n > 1 or blancos >= 2):
+                _cerrar(n)
+                n += 1
+            blancos = 0
+            actual.append(linea)
+        else:
+            blancos += 1
+    _cerrar(n)
+
+    return parrafos
+
+
+# Sustitución de saltos de línea en una sola pasada C, sin la copia
+# intermedia de strip().replace().
+_TABLA_RECORTE = str.maketrans({"\n": " "})
+
+
+def recortar_texto(texto: str, max_len: int = 280) -> str:
+    """
+    Recorta texto para mostrar como extracto breve.
+    Sustituye saltos de línea por espacios.
+    """
+    t = texto.translate(_TABLA_RECORTE).strip()
+    if len(t) <= max_len:
+        return t
+    return f"{t[:max_len - 3]}..."
+
+
+# -------------------
+# 2. Patrones globales
+# -------------------
+
+# Todo el cotejo de las reglas 0 a 8 se hace sobre el texto NORMALIZADO
+# (minúsculas y sin tildes, calculado una sola vez por párrafo): los
+# patrones se escriben ya en minúsculas sin tildes y se compilan sin
+# re.IGNORECASE, con lo que el motor se ahorra el plegado de mayúsculas
+# por carácter y las clases tipo "[oó]" desaparecen. Como efecto, el
+# cotejo pasa a ser además insensible a tildes de forma uniforme (antes
+# algunos términos exigían la tilde exacta).
+_TABLA_SIN_TILDES = str.maketrans("áéíóúÁÉÍÓÚñÑ", "aeiouaeiounn")
+
+# Las banderas de etiquetado se detectan con UNA alternancia de grupos
+# nombrados recorrida una sola vez por párrafo, en lugar de una búsqueda
+# completa por patrón (antes: 9 re.search por párrafo). Cada entrada es
+# (término, banderas); la tupla permite que un término encienda varias
+# banderas si hiciera falta.
+_TERMINOS_ETIQUETAS = [
+    # Duda probatoria
+    (r"no existe prueba suficiente", ("duda",)),
+    (r"no se ha acreditado", ("duda",)),
+    (r"no se ha demostrado", ("duda",)),
+    (r"no se ha probado", ("duda",)),
+    (r"no se cuenta con prueba suficiente", ("duda",)),
+    (r"no hay elementos suficientes", ("duda",)),
+    # Certeza / acreditacion plena
+    (r"ha quedado acreditado", ("certeza",)),
+    (r"se encuentra plenamente probado", ("certeza",)),
+    (r"plena certeza", ("certeza",)),
+    (r"se ha demostrado de manera fehaciente", ("certeza",)),
+    (r"plenamente demostrado", ("certeza",)),
+    # Hipotesis alternativas no descartadas
+    (r"no se descartan otras versiones", ("no_descarta_alt",)),
+    (r"no se descartan otras hipotesis", ("no_descarta_alt",)),
+    (r"no puede descartarse", ("no_descarta_alt",)),
+    (r"no puede excluirse", ("no_descarta_alt",)),
+    (r"no se ha descartado la version del imputado", ("no_descarta_alt",)),
+    # unica explicacion / unica conclusion
+    (r"unica explicacion posible", ("unica_explicacion",)),
+    (r"unica explicacion razonable", ("unica_explicacion",)),
+    (r"unica conclusion posible", ("unica_explicacion",)),
+    (r"la unica hipotesis plausible", ("unica_explicacion",)),
+    (r"la unica explicacion atendible", ("unica_explicacion",)),
+    # Estandar de sospecha
+    (r"sospecha simple", ("sospecha_simple",)),
+    (r"mera sospecha", ("sospecha_simple",)),
+    (r"sospecha inicial", ("sospecha_simple",)),
+    (r"sospecha grave", ("sospecha_grave",)),
+    (r"sospecha reveladora", ("sospecha_grave",)),
+    # Indicios (REGLA 1)
+    (r"\bindicios?\b", ("tiene_indicio",)),
+    (r"\bhechos? indiciarios?\b", ("tiene_indicio",)),
+    (r"\bhecho base\b", ("tiene_indicio",)),
+    # Fuentes fuertes / debiles
+    (r"\bpericia\b", ("fuente_fuerte",)),
+    (r"\binforme pericial\b", ("fuente_fuerte",)),
+    (r"\bperito\b", ("fuente_fuerte",)),
+    (r"\binforme tecnico\b", ("fuente_fuerte",)),
+    (r"\bdictamen\b", ("fuente_fuerte",)),
+    (r"\bpericia oficial\b", ("fuente_fuerte",)),
+    (r"\btestigo\b", ("fuente_debil",)),
+    (r"\bdeclaracion\b", ("fuente_debil",)),
+    (r"\bmanifestacion\b", ("fuente_debil",)),
+    (r"\bversion del imputado\b", ("fuente_debil",)),
+    # Valoracion conjunta (REGLA 1.3) y conexion entre indicios
+    # (REGLA 3): antes se buscaban sobre el texto completo concatenado;
+    # como banderas por parrafo basta un OR de columnas.
+    (r"en su conjunto", ("conjunto",)),
+    (r"considerados en su conjunto", ("conjunto",)),
+    (r"valorados en conjunto", ("conjunto",)),
+    (r"en forma conjunta", ("conjunto",)),
+    (r"en conjunto permiten concluir", ("conjunto",)),
+    (r"indicios convergentes", ("conjunto",)),
+    (r"coherentes entre si", ("conjunto",)),
+    (r"relacion logica", ("conexion",)),
+    (r"conexion", ("conexion",)),
+    (r"vinculo", ("conexion",)),
+    (r"enlace", ("conexion",)),
+    (r"coherencia externa", ("conexion",)),
+    (r"armoniza", ("conexion",)),
+]
+
+_BANDERAS_ETIQUETAS = (
+    "duda", "certeza", "no_descarta_alt", "unica_explicacion",
+    "sospecha_simple", "sospecha_grave",
+    "tiene_indicio", "fuente_fuerte", "fuente_debil",
+    "conjunto", "conexion",
+)
+
+# Columnas de la matriz booleana que comparten las reglas de detección.
+_COLUMNAS_BANDERAS = _BANDERAS_ETIQUETAS + ("eval_ind_debil", "eval_ind_fuerte")
+
+_IDX_BANDERA = {nombre: i for i, nombre in enumerate(_COLUMNAS_BANDERAS)}
+
+# Respaldo sin pyahocorasick: UNA alternancia por bandera, consultada
+# con search() (solo interesa la presencia). Las búsquedas por bandera
+# se mantienen independientes a propósito: con una única alternancia
+# fusionada, dos términos de banderas distintas que comparten posición
+# inicial se ocultan entre sí ("indicios convergentes" tapaba a
+# "indicios"), porque el motor solo reporta la primera rama que
+# coincide en cada posición. Como cada patrón va solo, tampoco hace
+# falta lookahead y RE2 puede compilarlos.
+_agrupados: Dict[tuple, List[str]] = {}
+for _patron, _banderas in _TERMINOS_ETIQUETAS:
+    _agrupados.setdefault(_banderas, []).append(_patron)
+PATRONES_ETIQUETAS = [
+    (_compilar("|".join(_patrones)), _banderas)
+    for _banderas, _patrones in _agrupados.items()
+]
+del _agrupados
+
+
+def _expandir_variantes(patron: str) -> List[str]:
+    """
+    Expande un patrón restringido (clases de un carácter tipo "[oó]" y
+    plurales "s?") a la lista de literales que cubre, para alimentar el
+    autómata de Aho-Corasick.
+    """
+    if not patron:
+        return [""]
+    if patron[0] == "[":
+        cierre = patron.index("]")
+        return [
+            opcion + resto
+            for opcion in patron[1:cierre]
+            for resto in _expandir_variantes(patron[cierre + 1:])
+        ]
+    if patron[1:2] == "?":
+        colas = _expandir_variantes(patron[2:])
+        return [patron[0] + cola for cola in colas] + colas
+    return [patron[0] + resto for resto in _expandir_variantes(patron[1:])]
+
+
+def _es_caracter_palabra(c: str) -> bool:
+    return c.isalnum() or c == "_"
+
+
+# ---------- REGLA 2 – Evaluación del indicio ----------
+# Los patrones originales usaban "ancla.{0,80}veredicto" con DOTALL, la
+# forma más costosa de patrón del módulo (el comodín dispara expansión
+# de estados del NFA en párrafos largos). Se reemplaza por la misma
+# condición calculada sobre desplazamientos: se recogen los finales de
+# cada ancla y los inicios de cada veredicto (con lookahead, para no
+# perder apariciones solapadas) y se comprueba si algún par queda a 80
+# caracteres o menos, con un recorrido de dos punteros.
+
+_EVAL_MAX_DISTANCIA = 80
+
+# Las tres alternancias de la evaluación son literales puros, así que
+# las posiciones se obtienen con str.find encadenado (la búsqueda C de
+# subcadenas) en lugar del finditer con lookahead: ninguna frase es
+# prefijo de otra, por lo que ambos recorridos ven los mismos calces.
+_EVAL_ANCLA_TERMINOS = ("medio de prueba", "elemento", "indicio", "prueba")
+
+_EVAL_DEBIL_TERMINOS = (
+    "no es concluyente", "no resulta concluyente", "no es determinante",
+    "no es suficiente", "es debil", "tiene escaso valor",
+    "poca fuerza acreditativa", "no permite afirmar", "solo sugiere",
+    "aporta poco", "limitado alcance probatorio",
+)
+
+_EVAL_FUERTE_TERMINOS = (
+    "es contundente", "resulta contundente", "es concluyente",
+    "resulta concluyente", "es determinante", "resulta determinante",
+    "es rotundo", "inequivoco", "de singular fuerza acreditativa",
+    "permite afirmar sin duda", "permite tener por cierto",
+    "permite tener por plenamente acreditado",
+)
+
+
+def _posiciones(t: str, terminos: tuple, al_final: bool = False) -> List[int]:
+    """
+    Posiciones ordenadas de cada aparición de cada término en t: el
+    inicio del calce o, con al_final, la posición siguiente al término.
+    """
+    salida: List[int] = []
+    for termino in terminos:
+        desplazo = len(termino) if al_final else 0
+        i = t.find(termino)
+        while i != -1:
+            salida.append(i + desplazo)
+            i = t.find(termino, i + 1)
+    salida.sort()
+    return salida
+
+
+def _hay_proximidad(finales_ancla: List[int], inicios_veredicto: List[int]) -> bool:
+    """
+    True si algun veredicto empieza entre 0 y _EVAL_MAX_DISTANCIA
+    caracteres despues del final de algun ancla. Ambas listas vienen
+    ordenadas; el recorrido es lineal.
+    """
+    i = 0
+    for inicio in inicios_veredicto:
+        while i < len(finales_ancla) and finales_ancla[i] < inicio - _EVAL_MAX_DISTANCIA:
+            i += 1
+        if i < len(finales_ancla) and finales_ancla[i] <= inicio:
+            return True
+    return False
+
+
+def _evaluar_indicio(t: str) -> tuple:
+    """
+    Devuelve (eval_ind_debil, eval_ind_fuerte) para un parrafo.
+    """
+    finales_ancla = _posiciones(t, _EVAL_ANCLA_TERMINOS, al_final=True)
+    if not finales_ancla:
+        return False, False
+
+    debil = _hay_proximidad(
+        finales_ancla, _posiciones(t, _EVAL_DEBIL_TERMINOS)
+    )
+    fuerte = _hay_proximidad(
+        finales_ancla, _posiciones(t, _EVAL_FUERTE_TERMINOS)
+    )
+    return debil, fuerte
+
+# ---------- TÉRMINOS DE LAS REGLAS 3 A 8 ----------
+# Todas estas condiciones son alternancias de literales puros, así que
+# no hace falta entrar al motor de regex: "kw in texto" despacha a la
+# búsqueda C de subcadenas (memmem), que para listas cortas es más
+# rápida que un patrón compilado. Cada antigua alternancia queda como
+# tupla de términos consultada con _contiene.
+
+
+def _contiene(texto: str, terminos: tuple) -> bool:
+    return any(t in texto for t in terminos)
+
+# REGLA 3 – Consistencia externa entre indicios
+TERMINOS_CONTRADICCION_INDICIOS = (
+    "no coincide con", "contradice", "incompatible con", "no guarda relacion",
+    "no se relaciona", "resulta incompatible", "es inconsistente con",
+    "se opone a", "discrepa",
+)
+
+# REGLA 4 – Saltos logicos tipicos
+TERMINOS_PRESENCIA = (
+    "por el solo hecho de encontrarse", "por el solo hecho de estar",
+    "basta la presencia", "por estar en el lugar",
+)
+
+TERMINOS_CONOCIMIENTO_R4 = (
+    "debia conocer", "sabia", "no podia ignorar", "tenia conocimiento",
+)
+
+TERMINOS_CARGO = (
+    "por su calidad de", "en su condicion de", "en su calidad de",
+    "por su cargo de",
+)
+
+TERMINOS_RESPONSAB = (
+    "es responsable", "dirigia", "ordeno", "autorizo", "dispuso",
+    "tenia dominio del hecho",
+)
+
+TERMINOS_CONCLUSION_FUERTE = (
+    "es evidente que", "resulta evidente que", "no cabe duda de que",
+    "resulta incuestionable que", "es indudable que",
+)
+
+TERMINOS_REFERENCIA_PRUEBA = (
+    "prueba", "pruebas", "indicio", "indicios", "hecho indiciario",
+    "hechos indiciarios", "pericia", "perito", "informe pericial",
+    "informe tecnico", "testigo", "testigos", "declaracion", "declaraciones",
+    "acta", "actas", "informe",
+)
+
+# REGLA 5 – Uso indebido de testimoniales
+TERMINOS_TESTIMONIO = (
+    "testigo", "declaracion", "manifestacion", "version del imputado",
+)
+
+TERMINOS_FUERZA_INDEBIDA = (
+    "indicio contundente", "prueba concluyente", "prueba determinante",
+    "prueba inequivoca", "permite tener por acreditado",
+    "demuestra claramente", "acredita fehacientemente",
+)
+
+TERMINOS_AUTORIA = (
+    "participo", "coordino", "dirigio", "ordeno", "autorizo",
+    "tenia dominio del hecho", "responsable del hecho",
+)
+
+# REGLA 6 – Cadena inferencial incompleta
+TERMINOS_CONCLUSION = (
+    "por tanto", "por ende", "en consecuencia", "por consiguiente",
+    "se concluye que", "queda acreditado que", "resulta acreditado que",
+    "resulta probado que", "se tiene por probado que",
+)
+
+TERMINOS_SUSTENTO = (
+    "prueba", "pruebas", "indicio", "indicios", "hecho indiciario",
+    "hechos indiciarios", "pericia", "perito", "acta", "informe", "testigo",
+    "declaracion", "documento",
+)
+
+TERMINOS_CAUSALIDAD = (
+    "lo cual demuestra que", "esto demuestra que", "ello demuestra que",
+    "lo que prueba que", "esto evidencia que", "ello evidencia que",
+    "lo que acredita que",
+)
+
+TERMINOS_AUTORIA_COORD = (
+    "coordino", "dirigio", "organizo", "autorizo", "dispuso", "controlo",
+    "tenia dominio del hecho",
+)
+
+TERMINOS_CONOCIMIENTO = (
+    "sabia que", "tenia conocimiento de", "no podia ignorar", "debia conocer",
+    "pleno conocimiento de",
+)
+
+# REGLA 7 – Valoracion contraria al contenido expreso de la prueba
+TERMINOS_MEDIO_PROBATORIO = (
+    "declaracion de", "declaro que", "manifiesto que", "segun el acta",
+    "segun consta en el acta", "acta policial", "acta fiscal",
+    "informe pericial", "informe tecnico", "pericia oficial",
+    "pericia practicada", "segun el informe",
+)
+
+TERMINOS_CONTENIDO_NEGATIVO = (
+    "no recuerda", "no reconocio", "no vio", "no observo",
+    "no estuvo presente", "no le consta", "no puede precisar",
+    "no puede afirmar", "no se aprecia", "no se advierte", "no se demuestra",
+    "no se acredita",
+)
+
+TERMINOS_CONCLUSION_FUERTE_PRUEBA = (
+    "de lo que se desprende que", "de ello se desprende que",
+    "lo que demuestra que", "lo que acredita que", "ello demuestra que",
+    "ello acredita que", "permite tener por acreditado que", "confirma que",
+    "demuestra claramente que", "acredita de manera concluyente que",
+)
+
+# REGLA 8 – Hipotesis alternativas mal tratadas
+TERMINOS_ALT_EXISTENCIA = (
+    "otras versiones", "otras explicaciones", "otras hipotesis",
+    "hipotesis alternativa", "version alternativa", "coartada",
+    "explicacion del imputado", "otra posible explicacion",
+)
+
+TERMINOS_NO_DESCARTA_ALT2 = (
+    "no se descartan", "no puede descartarse", "no puede excluirse",
+    "no se ha descartado", "no excluye la version del imputado",
+)
+
+TERMINOS_UNICA_CONCLUSION = (
+    "unica explicacion posible", "unica explicacion razonable",
+    "unica conclusion posible", "unica hipotesis plausible",
+    "unico camino logico", "conclusion inevitable",
+)
+
+TERMINOS_DESCARTAR_SIN_EXP = (
+    "no es creible", "no resulta razonable", "no convence al juzgador",
+    "no es atendible", "resulta inverosimil", "no tiene asidero",
+)
+
+TERMINOS_ANALISIS_ALT = (
+    "analiza la version alternativa", "contrasta la hipotesis",
+    "examina la explicacion del imputado", "evalua la version alternativa",
+)
+
+
+# ---------- TÉRMINOS DE LA REGLA 9 ----------
+# Como en el etiquetado, los términos van en minúsculas y sin tildes y
+# se buscan sobre el texto normalizado del párrafo.
+
+_GRUPOS_REGLA9 = (
+    ("max_exp", (
+        "maximas de la experiencia", "reglas de experiencia",
+        "reglas de la experiencia comun", "maximas de experiencia comun",
+    )),
+    ("sana", (
+        "sana critica", "reglas de la sana critica",
+        "principios de la sana critica",
+    )),
+    ("gen", (
+        "lo normal es que", "lo habitual es que",
+        "es de experiencia comun que", "es de conocimiento general que",
+        "suele ocurrir que", "es logico pensar que", "es natural que",
+    )),
+    ("est", (
+        "quien nada debe nada teme", "nadie inocente huye",
+        "quien huye es porque algo teme", "todo narcotraficante",
+        "todo delincuente", "ninguna persona honesta", "ningun inocente",
+    )),
+    ("sust", (
+        "prueba", "pruebas", "indicio", "indicios", "hecho indiciario",
+        "hechos indiciarios", "pericia", "perito", "informe pericial",
+        "informe tecnico", "estudio estadistico", "estadisticas",
+        "datos empiricos", "acta", "actas", "documento", "documentacion",
+    )),
+)
+
+# ---------- GRUPOS DE TÉRMINOS POR PRESENCIA ----------
+# Todas las consultas "¿aparece algún término del grupo X?" de las
+# REGLAS 3 a 9 se resuelven en la MISMA pasada del autómata que el
+# etiquetado: cada párrafo se recorre una sola vez y sale con el
+# conjunto de grupos presentes en p.grupos. Los términos de grupo no
+# llevan \b (los patrones originales tampoco), así que basta la
+# presencia del literal como subcadena. Sin pyahocorasick los grupos
+# se resuelven con _contiene sobre las mismas tuplas.
+
+_GRUPOS_TERMINOS: Dict[str, tuple] = {
+    "contradiccion_indicios": TERMINOS_CONTRADICCION_INDICIOS,
+    "presencia": TERMINOS_PRESENCIA,
+    "conocimiento_r4": TERMINOS_CONOCIMIENTO_R4,
+    "cargo": TERMINOS_CARGO,
+    "responsab": TERMINOS_RESPONSAB,
+    "conclusion_fuerte": TERMINOS_CONCLUSION_FUERTE,
+    "referencia_prueba": TERMINOS_REFERENCIA_PRUEBA,
+    "testimonio": TERMINOS_TESTIMONIO,
+    "fuerza_indebida": TERMINOS_FUERZA_INDEBIDA,
+    "autoria": TERMINOS_AUTORIA,
+    "conclusion": TERMINOS_CONCLUSION,
+    "sustento": TERMINOS_SUSTENTO,
+    "causalidad": TERMINOS_CAUSALIDAD,
+    "autoria_coord": TERMINOS_AUTORIA_COORD,
+    "conocimiento": TERMINOS_CONOCIMIENTO,
+    "medio_probatorio": TERMINOS_MEDIO_PROBATORIO,
+    "contenido_negativo": TERMINOS_CONTENIDO_NEGATIVO,
+    "conclusion_fuerte_prueba": TERMINOS_CONCLUSION_FUERTE_PRUEBA,
+    "alt_existencia": TERMINOS_ALT_EXISTENCIA,
+    "no_descarta_alt2": TERMINOS_NO_DESCARTA_ALT2,
+    "unica_conclusion": TERMINOS_UNICA_CONCLUSION,
+    "descartar_sin_exp": TERMINOS_DESCARTAR_SIN_EXP,
+    "analisis_alt": TERMINOS_ANALISIS_ALT,
+}
+_GRUPOS_TERMINOS.update(
+    (f"r9_{nombre}", terminos) for nombre, terminos in _GRUPOS_REGLA9
+)
+
+# El autómata busca los términos del etiquetado Y los grupos de las
+# reglas en una sola pasada lineal por párrafo. Cada palabra guarda
+# (largo, banderas con \b, banderas sin \b, grupos): las banderas "con
+# borde" reproducen los \b del patrón original comprobando que los
+# vecinos de la coincidencia no sean caracteres de palabra; los grupos
+# y las banderas sin borde se aplican siempre. Una misma palabra puede
+# alimentar varias entradas (p. ej. "prueba" es etiqueta, sustento y
+# r9_sust), por eso los destinos se funden antes de montar el autómata.
+if ahocorasick is not None:
+    _palabras: Dict[str, List[list]] = {}
+    for _patron, _banderas in _TERMINOS_ETIQUETAS:
+        _bordes = r"\b" in _patron
+        for _variante in _expandir_variantes(_patron.replace(r"\b", "")):
+            _destinos = _palabras.setdefault(_variante, [[], [], []])
+            _destinos[0 if _bordes else 1].extend(_banderas)
+    for _nombre, _terminos in _GRUPOS_TERMINOS.items():
+        for _termino in _terminos:
+            _palabras.setdefault(_termino, [[], [], []])[2].append(_nombre)
+
+    _AUTOMATA_ETIQUETAS = ahocorasick.Automaton()
+    for _variante, (_con_borde, _sin_borde, _grupos) in _palabras.items():
+        _AUTOMATA_ETIQUETAS.add_word(
+            _variante,
+            (len(_variante), tuple(_con_borde), tuple(_sin_borde),
+             tuple(_grupos)),
+        )
+    _AUTOMATA_ETIQUETAS.make_automaton()
+    del _palabras
+else:
+    _AUTOMATA_ETIQUETAS = None
+
+
+# -------------------
+# 3. Etiquetado de párrafos
+# -------------------
+
+@dataclass(slots=True)
+class Parrafo:
+    """
+    Párrafo etiquetado. Con slots, cada bandera es un atributo con carga
+    directa en C (sin tabla hash por registro): las reglas hacen decenas
+    de consultas por párrafo y el registro ocupa bastante menos memoria
+    que el dict de 16 claves que se construía antes.
+    """
+    n: int
+    texto: str
+    extracto: str
+    # Texto en minúsculas y sin tildes, contra el que cotejan las reglas.
+    norm: str
+    duda: bool = False
+    certeza: bool = False
+    no_descarta_alt: bool = False
+    unica_explicacion: bool = False
+    sospecha_simple: bool = False
+    sospecha_grave: bool = False
+    tiene_indicio: bool = False
+    fuente_fuerte: bool = False
+    fuente_debil: bool = False
+    conjunto: bool = False
+    conexion: bool = False
+    eval_ind_debil: bool = False
+    eval_ind_fuerte: bool = False
+    # Grupos de términos presentes en el párrafo (claves de
+    # _GRUPOS_TERMINOS); las REGLAS 3 a 9 consultan pertenencia aquí en
+    # lugar de volver a recorrer el texto.
+    grupos: frozenset = frozenset()
+
+
+def _etiquetar_uno(p: Dict[str, Any]) -> Parrafo:
+    """
+    Etiqueta un solo párrafo. Independiente del resto: es la unidad de
+    trabajo tanto de la ruta serial como de la paralela.
+    """
+    t = p["texto"]
+    # El extracto se calcula una sola vez por párrafo: un mismo párrafo
+    # puede aparecer en varios registros de incongruencia y antes se
+    # recortaba de nuevo en cada regla que lo citaba.
+    # Normalización única por párrafo: minúsculas y sin tildes. La
+    # traducción conserva la longitud, así que los desplazamientos
+    # sobre t_norm valen también para el texto original.
+    t_norm = t.translate(_TABLA_SIN_TILDES).lower()
+    etq = Parrafo(n=p["n"], texto=t, extracto=recortar_texto(t), norm=t_norm)
+
+    if _AUTOMATA_ETIQUETAS is not None:
+        grupos = set()
+        for fin, (largo, con_borde, sin_borde, en_grupos) in \
+                _AUTOMATA_ETIQUETAS.iter(t_norm):
+            for bandera in sin_borde:
+                setattr(etq, bandera, True)
+            if en_grupos:
+                grupos.update(en_grupos)
+            if con_borde:
+                inicio = fin - largo + 1
+                if inicio > 0 and _es_caracter_palabra(t_norm[inicio - 1]):
+                    continue
+                if fin + 1 < len(t_norm) and _es_caracter_palabra(t_norm[fin + 1]):
+                    continue
+                for bandera in con_borde:
+                    setattr(etq, bandera, True)
+        etq.grupos = frozenset(grupos)
+    else:
+        for patron, banderas in PATRONES_ETIQUETAS:
+            if patron.search(t_norm):
+                for bandera in banderas:
+                    setattr(etq, bandera, True)
+        etq.grupos = frozenset(
+            nombre for nombre, terminos in _GRUPOS_TERMINOS.items()
+            if _contiene(t_norm, terminos)
+        )
+
+    # Evaluación del indicio (REGLA 2):
+    etq.eval_ind_debil, etq.eval_ind_fuerte = _evaluar_indicio(t_norm)
+
+    return etq
+
+
+def _etiquetar_bloque(bloque: List[Dict[str, Any]]) -> List[Parrafo]:
+    return [_etiquetar_uno(p) for p in bloque]
+
+
+# Por debajo de este número de párrafos el montaje del pool cuesta más
+# que el etiquetado mismo y se usa la ruta serial.
+_UMBRAL_PARALELO = 64
+
+# Hilos del pool: acotados por los núcleos disponibles; más allá de 4
+# el reparto no mejora (el trabajo por párrafo es corto) y en máquinas
+# de un solo núcleo el pool es puro costo, así que se omite.
+_NUM_HILOS = min(4, os.cpu_count() or 1)
+
+
+def etiquetar_parrafos(parrafos: List[Dict[str, Any]]) -> List[Parrafo]:
+    """
+    Etiqueta cada párrafo con las banderas booleanas de los patrones
+    detectados y devuelve una lista de Parrafo.
+
+    Las banderas literales y los grupos de términos de las reglas salen
+    de una sola pasada del autómata (o de PATRONES_ETIQUETAS y
+    _contiene como respaldo); la evaluación del indicio (REGLA 2) se
+    resuelve aparte con la comprobación de proximidad ancla–veredicto.
+
+    Cada párrafo es independiente, así que en documentos grandes los
+    bloques se reparten entre hilos (mismo patrón que el evaluador). El
+    orden de la lista devuelta es el de entrada: ex.map preserva el
+    orden de los bloques.
+    """
+    if _NUM_HILOS < 2 or len(parrafos) < _UMBRAL_PARALELO:
+        return _etiquetar_bloque(parrafos)
+
+    paso = -(-len(parrafos) // _NUM_HILOS)
+    bloques = [parrafos[i:i + paso] for i in range(0, len(parrafos), paso)]
+    with ThreadPoolExecutor(max_workers=len(bloques)) as ex:
+        return list(chain.from_iterable(ex.map(_etiquetar_bloque, bloques)))
+
+
+# -------------------
+# 4. Reglas de incongruencia
+# -------------------
+
+# Las REGLAS 4.0.1, 4.0.2 y 2.2 emiten hasta 3 pares (i, j) de párrafos
+# con banderas contradictorias. Cada fila define una regla de pares:
+# (columna A, columna B, exigir párrafos distintos).
+_REGLAS_PARES = np.array(
+    [
+        [_IDX_BANDERA["duda"], _IDX_BANDERA["certeza"], 0],
+        [_IDX_BANDERA["no_descarta_alt"], _IDX_BANDERA["unica_explicacion"], 0],
+        [_IDX_BANDERA["eval_ind_debil"], _IDX_BANDERA["eval_ind_fuerte"], 1],
+    ],
+    dtype=np.int64,
+)
+
+_MAX_PARES = 3
+
+
+def _nucleo_pares(banderas: np.ndarray, reglas: np.ndarray, salida: np.ndarray) -> int:
+    """
+    Enumera, para cada regla de pares, hasta _MAX_PARES pares (i, j) con
+    banderas[i, colA] y banderas[j, colB], en el mismo orden que el
+    doble bucle original. Escribe filas (regla, i, j) en salida y
+    devuelve cuántas escribió. Trabajo puramente entero/booleano sobre
+    arreglos contiguos: el candidato ideal para numba.
+    """
+    total = 0
+    for r in range(reglas.shape[0]):
+        col_a = reglas[r, 0]
+        col_b = reglas[r, 1]
+        distintos = reglas[r, 2]
+        emitidos = 0
+        for i in range(banderas.shape[0]):
+            if not banderas[i, col_a]:
+                continue
+            for j in range(banderas.shape[0]):
+                if not banderas[j, col_b]:
+                    continue
+                if distintos and i == j:
+                    continue
+                salida[total, 0] = r
+                salida[total, 1] = i
+                salida[total, 2] = j
+                total += 1
+                emitidos += 1
+                if emitidos == _MAX_PARES:
+                    break
+            if emitidos == _MAX_PARES:
+                break
+    return total
+
+
+if numba is not None:
+    _nucleo_pares = numba.njit(cache=True)(_nucleo_pares)
+    # Compilación anticipada: el costo del JIT se paga al importar y no
+    # en el primer análisis (mismo criterio que en el evaluador).
+    _nucleo_pares(
+        np.zeros((1, len(_COLUMNAS_BANDERAS)), dtype=np.bool_),
+        _REGLAS_PARES,
+        np.empty((_MAX_PARES * len(_REGLAS_PARES), 3), dtype=np.int64),
+    )
+
+
+# Selecciones de párrafos por banderas que consumen las reglas de un
+# solo párrafo. La función que las calcula se GENERA al importar:
+# cada selección se desenrolla a un np.flatnonzero con los índices de
+# columna como literales, sin búsquedas por nombre ni despacho por
+# regla en tiempo de análisis.
+_SELECCIONES = (
+    ("sospecha_simple",),
+    ("sospecha_grave",),
+    ("tiene_indicio",),
+    ("eval_ind_debil", "eval_ind_fuerte"),
+)
+
+
+def _generar_escaner():
+    lineas = ["def _seleccionar(banderas, parrafos):", "    return ("]
+    for columnas in _SELECCIONES:
+        expr = " & ".join(
+            "banderas[:, %d]" % _IDX_BANDERA[c] for c in columnas
+        )
+        lineas.append(
+            "        [parrafos[i] for i in np.flatnonzero(%s)]," % expr
+        )
+    lineas.append("    )")
+    espacio = {"np": np}
+    exec(compile("\n".join(lineas), "<selecciones>", "exec"), espacio)
+    return espacio["_seleccionar"]
+
+
+_seleccionar = _generar_escaner()
+
+
+@dataclass(slots=True, frozen=True)
+class Incongruencia:
+    """
+    Incongruencia detectada. Registro inmutable con slots: los campos son
+    fijos (antes, dicts con siempre las mismas 4 claves), el acceso por
+    atributo es más barato que por clave y la inmutabilidad garantiza que
+    los consumidores (app, informe, caché del Detector) no se pisen entre sí.
+    """
+    tipo: str
+    parrafos: tuple
+    detalle: str
+    extractos: tuple
+
+
+def detectar_incongruencias(parrafos: List[Dict[str, Any]]) -> List[Incongruencia]:
+    """
+    Aplica las REGLAS 0–9 y devuelve una lista de posibles incongruencias
+    (registros Incongruencia), cada una con:
+    - tipo
+    - párrafos involucrados
+    - detalle
+    - extractos (fragmentos de texto)
+    """
+    resultados: List[Incongruencia] = []
+
+    # Deduplicación incremental: si varias ramas de una misma regla
+    # coinciden sobre el mismo párrafo, el registro (tipo, párrafos) se
+    # emite una sola vez, sin pasada de limpieza posterior.
+    vistos: set = set()
+
+    def _agregar(lista, tipo, parrafos, detalle, extractos):
+        clave = (tipo, tuple(parrafos))
+        if clave not in vistos:
+            vistos.add(clave)
+            lista.append(
+                Incongruencia(tipo, clave[1], detalle, tuple(extractos))
+            )
+
+    # Matriz booleana (párrafos × banderas) construida una sola vez: las
+    # selecciones por regla salen de np.flatnonzero sobre sus columnas en
+    # lugar de una comprensión Python por bandera, y las combinaciones
+    # (como débil ∧ fuerte de la REGLA 2.1) son un AND vectorizado.
+    banderas = np.array(
+        [[getattr(p, c) for c in _COLUMNAS_BANDERAS] for p in parrafos], dtype=bool
+    ).reshape(len(parrafos), len(_COLUMNAS_BANDERAS))
+
+    # Pares contradictorios de las REGLAS 4.0.1, 4.0.2 y 2.2, emitidos
+    # por el núcleo (compilado con numba cuando está disponible); cada
+    # regla los consume luego en su posición original.
+    salida_pares = np.empty((_MAX_PARES * len(_REGLAS_PARES), 3), dtype=np.int64)
+    total_pares = _nucleo_pares(banderas, _REGLAS_PARES, salida_pares)
+    pares_por_regla: List[List[tuple]] = [[] for _ in range(len(_REGLAS_PARES))]
+    for k in range(total_pares):
+        regla, i, j = salida_pares[k]
+        pares_por_regla[regla].append((parrafos[i], parrafos[j]))
+
+    # Selecciones desenrolladas por el escáner generado al importar.
+    (
+        con_sospecha_simple,
+        con_sospecha_grave,
+        con_indicio,
+        con_ambas_eval,
+    ) = _seleccionar(banderas, parrafos)
+
+    # --------------------------------------------------
+    # 4.0 Reglas generales (duda vs certeza, sospecha)
+    # --------------------------------------------------
+
+    # 4.0.1 Contradicción duda vs certeza (pares ya acotados a 3)
+    for pd, pc in pares_por_regla[0]:
+        _agregar(resultados,
+                tipo="Contradicción duda vs certeza",
+                parrafos=[pd.n, pc.n],
+                detalle=(
+                    "En un párrafo se afirma insuficiencia probatoria y en otro certeza plena, "
+                    "sin justificar la transición."
+                ),
+                extractos=[
+                    pd.extracto,
+                    pc.extracto,
+                ],
+        )
+
+    # 4.0.2 Incongruencia en hipótesis alternativas
+    for pa, pu in pares_por_regla[1]:
+        _agregar(resultados,
+                tipo="Incongruencia en hipótesis alternativas",
+                parrafos=[pa.n, pu.n],
+                detalle=(
+                    "Se afirma que no se descartan hipótesis alternativas, "
+                    "pero a la vez se sostiene que existe una única explicación."
+                ),
+                extractos=[
+                    pa.extracto,
+                    pu.extracto,
+                ],
+        )
+
+    # 4.0.3 Referencia a sospecha simple
+    if con_sospecha_simple:
+        for ps in con_sospecha_simple:
+            _agregar(resultados,
+                    tipo="Referencia a 'sospecha simple' o equivalente",
+                    parrafos=[ps.n],
+                    detalle=(
+                        "Se menciona 'sospecha simple' o equivalente; debe verificarse su compatibilidad "
+                        "con el estándar exigido en la resolución (p. ej., prisión preventiva)."
+                    ),
+                    extractos=[ps.extracto],
+        )
+
+    # 4.0.4 Tensión entre sospecha simple y grave
+    if con_sospecha_simple and con_sospecha_grave:
+        _agregar(resultados,
+                tipo="Tensión entre 'sospecha simple' y 'sospecha grave'",
+                parrafos=[p.n for p in con_sospecha_simple + con_sospecha_grave],
+                detalle=(
+                    "En distintos párrafos se menciona tanto 'sospecha simple' "
+                    "como 'sospecha grave', lo que exige clarificación del estándar aplicado."
+                ),
+                extractos=[
+                    p.extracto for p in con_sospecha_simple + con_sospecha_grave
+                ],
+        )
+
+    # ============================================================
+    #  REGLA 1 – Pluralidad y convergencia de indicios
+    # ============================================================
+
+    parrafos_con_indicio = con_indicio
+
+    # 1.1 Ausencia total de referencia a indicios
+    if len(parrafos_con_indicio) == 0 and parrafos:
+        _agregar(resultados,
+            tipo="Ausencia de referencia explícita a indicios o hechos indiciarios",
+            parrafos=[p.n for p in parrafos[:3]],
+            detalle=(
+                "No se identifican menciones a indicios o hechos indiciarios, pese a tratarse "
+                "de una resolución que pretende utilizar razonamiento indiciario."
+            ),
+            extractos=[p.extracto for p in parrafos[:3]],
+        )
+
+    # 1.2 Indicio único débil
+    if len(parrafos_con_indicio) == 1:
+        unico = parrafos_con_indicio[0]
+        if unico.fuente_debil and not unico.fuente_fuerte:
+            _agregar(resultados,
+                tipo="Indicio único sin singular fuerza acreditativa",
+                parrafos=[unico.n],
+                detalle=(
+                    "El único indicio identificado proviene de fuente testimonial débil y "
+                    "se presenta como suficiente, vulnerando el método indiciario."
+                ),
+                extractos=[unico.extracto],
+        )
+
+    # 1.3 Pluralidad sin convergencia
+    if len(parrafos_con_indicio) >= 2:
+        # La búsqueda sobre el texto completo concatenado se sustituye
+        # por el OR de la columna "conjunto", ya calculada por párrafo.
+        hay_convergencia = bool(banderas[:, _IDX_BANDERA["conjunto"]].any())
+        if not hay_convergencia:
+            _agregar(resultados,
+                tipo="Pluralidad de indicios sin explicación de convergencia/interrelación",
+                parrafos=[p.n for p in parrafos_con_indicio],
+                detalle=(
+                    "Existen varios indicios pero sin valoración conjunta o convergente."
+                ),
+                extractos=[p.extracto for p in parrafos_con_indicio[:4]],
+        )
+
+    # ============================================================
+    #  REGLA 2 – Consistencia interna del indicio
+    # ============================================================
+
+    # 2.1 mismo párrafo: fuerte + débil (AND vectorizado de columnas)
+    for p in con_ambas_eval:
+        _agregar(resultados,
+            tipo="Valoración interna contradictoria del indicio (mismo párrafo)",
+            parrafos=[p.n],
+            detalle=(
+                "En un mismo párrafo se califica un indicio como débil y fuerte a la vez."
+            ),
+            extractos=[p.extracto],
+        )
+
+    # 2.2 entre párrafos distintos
+    for pd, pf in pares_por_regla[2]:
+        _agregar(resultados,
+            tipo="Evaluación contradictoria del indicio (párrafos distintos)",
+            parrafos=[pd.n, pf.n],
+            detalle=(
+                "En un párrafo se describe un indicio como débil y en otro como fuerte o concluyente."
+            ),
+            extractos=[pd.extracto, pf.extracto],
+        )
+
+    # ============================================================
+    #  REGLA 3 – Consistencia externa entre indicios
+    # ============================================================
+
+    for p in parrafos_con_indicio:
+        if "contradiccion_indicios" in p.grupos:
+            _agregar(resultados,
+                tipo="Contradicción explícita entre indicios",
+                parrafos=[p.n],
+                detalle="Se explicita incompatibilidad entre indicios o hechos indiciarios.",
+                extractos=[p.extracto],
+        )
+
+    if len(parrafos_con_indicio) >= 2 and not banderas[:, _IDX_BANDERA["conexion"]].any():
+        _agregar(resultados,
+            tipo="Falta de conexión entre indicios (consistencia externa)",
+            parrafos=[p.n for p in parrafos_con_indicio],
+            detalle="Los indicios no aparecen conectados ni articulados entre sí.",
+            extractos=[p.extracto for p in parrafos_con_indicio[:4]],
+        )
+
+    # ============================================================
+    #  REGLAS 4 a 8 – una sola pasada por los párrafos
+    # ============================================================
+    # Antes cada regla lanzaba su propio "for p in parrafos" (seis
+    # barridos completos de la lista). Se funden en UNA pasada que
+    # acumula los registros en una cubeta por bucle original y los
+    # vuelca en el mismo orden al terminar, así la salida no cambia.
+    # Los patrones consultados varias veces por párrafo (sustento,
+    # testimonio, alternativas, conclusión única) se buscan una vez.
+
+    c_presencia: List[Incongruencia] = []
+    c_cargo: List[Incongruencia] = []
+    c_categorica: List[Incongruencia] = []
+    c_testimonio_fuerte: List[Incongruencia] = []
+    c_testimonio_autoria: List[Incongruencia] = []
+    c_cadena: List[Incongruencia] = []
+    c_autoria_conoc: List[Incongruencia] = []
+    c_contra_prueba: List[Incongruencia] = []
+    c_alternativas: List[Incongruencia] = []
+
+    for p in parrafos:
+        grupos_p = p.grupos
+
+        # Pre-filtro: todas las ramas de las REGLAS 4 a 8 exigen al menos
+        # un grupo presente, así que un párrafo sin grupos (el caso común
+        # en resoluciones largas) se despacha con una sola comprobación.
+        if not grupos_p:
+            continue
+
+        tiene_testimonio = "testimonio" in grupos_p
+        tiene_sustento = "sustento" in grupos_p
+        tiene_alt = "alt_existencia" in grupos_p
+        tiene_unica = "unica_conclusion" in grupos_p
+
+        # REGLA 4 – Saltos lógicos típicos
+        if "presencia" in grupos_p and "conocimiento_r4" in grupos_p:
+            _agregar(c_presencia,
+                tipo="Salto presencia física → conocimiento/participación",
+                parrafos=[p.n],
+                detalle="Se infiere conocimiento o participación solo desde la presencia física.",
+                extractos=[p.extracto],
+        )
+
+        if "cargo" in grupos_p and "responsab" in grupos_p:
+            _agregar(c_cargo,
+                tipo="Salto de cargo/jerarquía → autoría/responsabilidad penal",
+                parrafos=[p.n],
+                detalle="Se deduce autoría o responsabilidad penal solo por el cargo.",
+                extractos=[p.extracto],
+        )
+
+        if "conclusion_fuerte" in grupos_p and "referencia_prueba" not in grupos_p:
+            _agregar(c_categorica,
+                    tipo="Conclusión categórica sin referencia explícita a prueba/indicios",
+                    parrafos=[p.n],
+                    detalle=(
+                        "Se formulan conclusiones categóricas sin mencionar pruebas o indicios de soporte."
+                    ),
+                    extractos=[p.extracto],
+        )
+
+        # REGLA 5 – Uso indebido de testimoniales
+        if tiene_testimonio and "fuerza_indebida" in grupos_p:
+            _agregar(c_testimonio_fuerte,
+                tipo="Uso indebido de testimonial como indicio fuerte",
+                parrafos=[p.n],
+                detalle=(
+                    "Una fuente testimonial es presentada como prueba concluyente o contundente."
+                ),
+                extractos=[p.extracto],
+        )
+
+        if tiene_testimonio and "autoria" in grupos_p:
+            _agregar(c_testimonio_autoria,
+                tipo="Salto testimonial → autoría/responsabilidad",
+                parrafos=[p.n],
+                detalle=(
+                    "Una declaración testimonial se utiliza para afirmar participación o autoría "
+                    "sin puente indiciario objetivo."
+                ),
+                extractos=[p.extracto],
+        )
+
+        # REGLA 6 – Cadena inferencial incompleta
+        if not tiene_sustento and "conclusion" in grupos_p:
+            _agregar(c_cadena,
+                tipo="Conclusión sin sustento indiciario previo",
+                parrafos=[p.n],
+                detalle=(
+                    "Se formula una conclusión fuerte sin integrar pruebas o indicios en el propio razonamiento."
+                ),
+                extractos=[p.extracto],
+        )
+
+        if not tiene_sustento and "causalidad" in grupos_p:
+            _agregar(c_cadena,
+                    tipo="Afirmación causal sin explicación del vínculo (salto lógico)",
+                    parrafos=[p.n],
+                    detalle=(
+                        "Se afirma que algo 'demuestra' o 'evidencia' un hecho sin explicitar "
+                        "el vínculo entre los hechos y la conclusión."
+                    ),
+                    extractos=[p.extracto],
+        )
+
+        if not tiene_sustento and "autoria_coord" in grupos_p:
+            _agregar(c_autoria_conoc,
+                    tipo="Afirmación de coordinación/autoría sin sustento indiciario",
+                    parrafos=[p.n],
+                    detalle=(
+                        "Se afirma coordinación, dirección u organización sin integrar indicios concretos."
+                    ),
+                    extractos=[p.extracto],
+        )
+
+        if not tiene_sustento and "conocimiento" in grupos_p:
+            _agregar(c_autoria_conoc,
+                    tipo="Afirmación de conocimiento sin sustento probatorio",
+                    parrafos=[p.n],
+                    detalle=(
+                        "Se afirma que el imputado 'sabía' o 'debía conocer' sin identificar el indicio que lo acredita."
+                    ),
+                    extractos=[p.extracto],
+        )
+
+        # REGLA 7 – Valoración contraria al contenido expreso de la prueba
+        if (
+            "medio_probatorio" in grupos_p
+            and "contenido_negativo" in grupos_p
+            and "conclusion_fuerte_prueba" in grupos_p
+        ):
+            _agregar(c_contra_prueba,
+                    tipo="Valoración contraria al contenido expreso del medio probatorio (mismo párrafo)",
+                    parrafos=[p.n],
+                    detalle=(
+                        "Se presenta un medio probatorio como demostrativo cuando el propio texto "
+                        "reconoce que su contenido es negativo o dubitativo."
+                    ),
+                    extractos=[p.extracto],
+        )
+
+        # REGLA 8 – Hipótesis alternativas mal tratadas
+        if tiene_alt and tiene_unica:
+            _agregar(c_alternativas,
+                    tipo="Incongruencia: reconoce alternativas pero afirma única explicación",
+                    parrafos=[p.n],
+                    detalle=(
+                        "Se reconocen hipótesis alternativas pero se mantiene una 'única explicación' como definitiva."
+                    ),
+                    extractos=[p.extracto],
+        )
+
+        if tiene_unica and "no_descarta_alt2" in grupos_p:
+            _agregar(c_alternativas,
+                    tipo="No se descartan alternativas pero se afirma conclusión única",
+                    parrafos=[p.n],
+                    detalle=(
+                        "Se admite que no se descartan otras hipótesis y aun así se afirma una única conclusión."
+                    ),
+                    extractos=[p.extracto],
+        )
+
+        if tiene_alt and "analisis_alt" not in grupos_p:
+            _agregar(c_alternativas,
+                    tipo="Mención de hipótesis alternativas sin análisis",
+                    parrafos=[p.n],
+                    detalle=(
+                        "Se mencionan explicaciones alternativas sin analizarlas ni contrastarlas."
+                    ),
+                    extractos=[p.extracto],
+        )
+
+        if tiene_alt and "descartar_sin_exp" in grupos_p:
+            _agregar(c_alternativas,
+                    tipo="Descarte injustificado de hipótesis alternativa",
+                    parrafos=[p.n],
+                    detalle=(
+                        "Se descarta una versión alternativa con fórmulas vacías ('no es creíble', etc.) "
+                        "sin justificación probatoria."
+                    ),
+                    extractos=[p.extracto],
+        )
+
+        if tiene_unica and not tiene_alt:
+            _agregar(c_alternativas,
+                    tipo="Conclusión única sin contrastar hipótesis alternativas",
+                    parrafos=[p.n],
+                    detalle=(
+                        "Se sostiene una 'única explicación' sin referencia a posibles hipótesis alternativas."
+                    ),
+                    extractos=[p.extracto],
+        )
+
+    # Volcado en el orden de los bucles originales.
+    resultados.extend(c_presencia)
+    resultados.extend(c_cargo)
+    resultados.extend(c_categorica)
+    resultados.extend(c_testimonio_fuerte)
+    resultados.extend(c_testimonio_autoria)
+
+    if len(parrafos_con_indicio) == 1:
+        unico = parrafos_con_indicio[0]
+        if unico.fuente_debil and "fuerza_indebida" in unico.grupos:
+            _agregar(resultados,
+                    tipo="Indicio único testimonial tratado como prueba fuerte",
+                    parrafos=[unico.n],
+                    detalle=(
+                        "El único indicio, de fuente testimonial, es tratado como prueba contundente."
+                    ),
+                    extractos=[unico.extracto],
+        )
+
+    resultados.extend(c_cadena)
+    resultados.extend(c_autoria_conoc)
+    resultados.extend(c_contra_prueba)
+    resultados.extend(c_alternativas)
+
+    # ============================================================
+    #  REGLA 9 – Máximas de experiencia y sana crítica mal aplicadas
+    # ============================================================
+
+    for p in parrafos:
+        g = p.grupos
+        # Mismo pre-filtro que en las REGLAS 4 a 8: sin grupos no hay
+        # rama de la REGLA 9 que pueda dispararse.
+        if not g:
+            continue
+        if (("r9_max_exp" in g or "r9_sana" in g)
+                and "r9_sust" not in g):
+            _agregar(resultados,
+                    tipo="Invocación abstracta de máximas de experiencia/sana crítica sin explicación",
+                    parrafos=[p.n],
+                    detalle=(
+                        "Se invocan genéricamente máximas de experiencia o sana crítica sin explicarlas "
+                        "ni vincularlas con datos empíricos ni pruebas."
+                    ),
+                    extractos=[p.extracto],
+        )
+
+        if "r9_gen" in g and "r9_sust" not in g:
+            _agregar(resultados,
+                    tipo="Generalización empírica sin sustento probatorio",
+                    parrafos=[p.n],
+                    detalle=(
+                        "Se usan fórmulas como 'lo normal es que', 'es de experiencia común que', "
+                        "sin apoyo en datos empíricos o pruebas específicas."
+                    ),
+                    extractos=[p.extracto],
+        )
+
+        if "r9_est" in g:
+            _agregar(resultados,
+                    tipo="Uso de máximas de experiencia estereotipadas/prejuiciosas",
+                    parrafos=[p.n],
+                    detalle=(
+                        "Se utilizan estereotipos ('quien nada debe nada teme', etc.) como si fueran "
+                        "verdaderas máximas de experiencia."
+                    ),
+                    extractos=[p.extracto],
+        )
+
+    return resultados
+
+
+# -------------------
+# 5. Función principal para la app
+# -------------------
+
+# Entradas que retiene el caché de análisis de cada Detector.
+_TAM_CACHE_ANALISIS = 32
+
+
+class Detector:
+    """
+    Fachada para uso en servicios que procesan muchas resoluciones por
+    proceso (una API, un lote). El autómata, los patrones y los núcleos
+    compilados se construyen UNA vez al importar el módulo; una
+    instancia de Detector los reutiliza llamada tras llamada, sin costo
+    de montaje por resolución.
+
+    Cada instancia guarda además un caché LRU de resultados por huella
+    BLAKE2b del texto: el análisis es una función pura del texto y
+    Streamlit vuelve a llamar en cada interacción con los widgets, así
+    que el mismo documento no se reanaliza. La huella (16 bytes) evita
+    retener los textos completos como claves.
+    """
+
+    def __init__(self) -> None:
+        self._cache: "OrderedDict[bytes, List[Incongruencia]]" = OrderedDict()
+
+    def analizar(self, texto: str, resultados: Dict[str, Any] = None) -> List[Incongruencia]:
+        """
+        Analiza una resolución y devuelve la lista de incongruencias.
+        """
+        if not texto or not texto.strip():
+            return []
+
+        huella = hashlib.blake2b(texto.encode(), digest_size=16).digest()
+        guardado = self._cache.get(huella)
+        if guardado is not None:
+            self._cache.move_to_end(huella)
+            return list(guardado)
+
+        parrafos = segmentar_parrafos(texto)
+        parrafos_etq = etiquetar_parrafos(parrafos)
+        salida = detectar_incongruencias(parrafos_etq)
+
+        self._cache[huella] = salida
+        if len(self._cache) > _TAM_CACHE_ANALISIS:
+            self._cache.popitem(last=False)
+        # Copia superficial: el llamador puede reordenar o filtrar su
+        # lista sin contaminar la entrada cacheada.
+        return list(salida)
+
+
+# Instancia compartida que respalda la función de módulo.
+_DETECTOR = Detector()
+
+
+def analizar_incongruencias(texto: str, resultados: Dict[str, Any] = None) -> List[Incongruencia]:
+    """
+    Función principal llamada por la app de Streamlit.
+
+    - texto: sentencia completa (obligatorio)
+    - resultados: dict devuelto por el evaluador (opcional, por ahora no se usa)
+
+    Devuelve una lista de registros Incongruencia con lo detectado.
+    """
+    return _DETECTOR.analizar(texto, resultados)
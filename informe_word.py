@@ -1,227 +1,364 @@
-from io import BytesIO
-from typing import Dict, Any, List
-from docx import Document
-from docx.shared import Pt
-
-
-# ============================
-# UTILIDADES DE FORMATO
-# ============================
-
-def agregar_titulo(doc: Document, texto: str, size: int = 16, bold: bool = True):
-    """
-    Agrega un título o subtítulo al documento, con tamaño y negrita configurables.
-    """
-    p = doc.add_paragraph()
-    r = p.add_run(texto)
-    r.bold = bold
-    r.font.size = Pt(size)
-
-
-def agregar_parrafo(doc: Document, texto: str, size: int = 11, bold: bool = False):
-    """
-    Agrega un párrafo estándar al documento.
-    """
-    p = doc.add_paragraph()
-    r = p.add_run(texto)
-    r.bold = bold
-    r.font.size = Pt(size)
-
-
-def agregar_tabla_criterios(doc: Document, criterios: Dict[str, Any]):
-    """
-    Agrega una tabla con los criterios (C1, C2, ..., C13) y sus puntajes.
-    """
-    if not criterios:
-        agregar_parrafo(doc, "No se encontraron criterios evaluados.")
-        return
-
-    # Cabecera de tabla
-    table = doc.add_table(rows=1, cols=2)
-    table.style = "Table Grid"
-
-    hdr_cells = table.rows[0].cells
-    hdr_cells[0].text = "Criterio"
-    hdr_cells[1].text = "Puntaje"
-
-    # Ordenamos los criterios por nombre (C1, C2, ..., C13) para que quede prolijo
-    for k in sorted(criterios.keys()):
-        v = criterios[k]
-        row_cells = table.add_row().cells
-        row_cells[0].text = str(k)
-        row_cells[1].text = str(v)
-
-
-def agregar_incongruencias(doc: Document, incong: Any):
-    """
-    Agrega al informe la sección de incongruencias detectadas.
-
-    - Si 'incong' es:
-      * None o lista vacía → indica que no se detectaron.
-      * List[dict] → formato estructurado del módulo incongruencias.py
-      * str / dict genérico → se imprime tal cual, como respaldo.
-    """
-    if not incong:
-        agregar_parrafo(doc, "No se registraron incongruencias detectadas.")
-        return
-
-    # Caso 1: lista estructurada proveniente de analizar_incongruencias()
-    if isinstance(incong, list) and incong and isinstance(incong[0], dict):
-        for i, item in enumerate(incong, 1):
-            tipo = item.get("tipo", "Incongruencia sin tipo especificado")
-            parrafos = item.get("parrafos", [])
-            detalle = item.get("detalle", "")
-            extractos: List[str] = item.get("extractos", [])
-
-            # Encabezado numerado
-            agregar_parrafo(doc, f"{i}. {tipo}", bold=True)
-
-            # Párrafos afectados
-            if parrafos:
-                parrafos_str = ", ".join(str(n) for n in parrafos)
-                agregar_parrafo(doc, f"Párrafos involucrados: {parrafos_str}")
-
-            # Detalle
-            if detalle:
-                agregar_parrafo(doc, f"Detalle: {detalle}")
-
-            # Extractos
-            if extractos:
-                agregar_parrafo(doc, "Extractos relevantes:", bold=True)
-                for ex in extractos:
-                    p = doc.add_paragraph(style=None)
-                    run = p.add_run(f"- {ex}")
-                    run.font.size = Pt(10)
-
-            # Línea en blanco entre incongruencias
-            agregar_parrafo(doc, "")
-        return
-
-    # Caso 2: si solo es un string (respaldo)
-    if isinstance(incong, str):
-        agregar_parrafo(doc, incong)
-        return
-
-    # Caso 3: si es un dict genérico
-    if isinstance(incong, dict):
-        for k, v in incong.items():
-            agregar_parrafo(doc, f"- {k}: {v}")
-        return
-
-    # Caso 4: cualquier otro tipo → lo imprimimos en bruto
-    agregar_parrafo(doc, str(incong))
-
-
-# ============================
-# FUNCIÓN PRINCIPAL
-# ============================
-
-def generar_informe(texto: str, resultados: Dict[str, Any], incong: Any) -> bytes:
-    """
-    Genera un informe en formato .docx (devuelto como bytes) a partir de:
-
-    - texto: sentencia analizada (por ahora solo se usa para contexto futuro).
-    - resultados: dict devuelto por el evaluador (criterios, ICI, interpretación).
-    - incong: lista de incongruencias devuelta por analizar_incongruencias().
-
-    Retorna: bytes listos para usar en st.download_button en Streamlit.
-    """
-    doc = Document()
-
-    # ============================
-    # PORTADA
-    # ============================
-    agregar_titulo(doc, "INFORME DE COHERENCIA INDICIARIA – ICI V7", size=18)
-    agregar_parrafo(doc, "Sistema de Auditoría Indiciaria ACRJ – Versión 7.")
-    agregar_parrafo(doc, "")
-    agregar_parrafo(
-        doc,
-        "Este informe resume el análisis automatizado realizado sobre la resolución o sentencia "
-        "cargada, aplicando criterios de coherencia indiciaria y reglas de detección de "
-        "incongruencias lógicas y normativas.",
-    )
-    doc.add_page_break()
-
-    # ============================
-    # 1. RESUMEN ICI
-    # ============================
-    agregar_titulo(doc, "1. RESUMEN DEL ÍNDICE DE COHERENCIA INDICIARIA", size=14)
-
-    # Extraer datos del dict de resultados
-    criterios = resultados.get("criterios", {}) if isinstance(resultados, dict) else {}
-    ici_sin = resultados.get("ICI_sin_penalizacion", None) if isinstance(resultados, dict) else None
-    ici_aj = resultados.get("ICI_ajustado", None) if isinstance(resultados, dict) else None
-    interpretacion = resultados.get("interpretacion", "") if isinstance(resultados, dict) else ""
-
-    if ici_sin is not None:
-        agregar_parrafo(doc, f"ICI sin penalización: {ici_sin}", bold=True)
-    if ici_aj is not None:
-        agregar_parrafo(doc, f"ICI ajustado (con frenos de emergencia): {ici_aj}", bold=True)
-
-    agregar_parrafo(doc, "")
-    agregar_parrafo(doc, "Interpretación cualitativa:", bold=True)
-    if interpretacion:
-        agregar_parrafo(doc, interpretacion)
-    else:
-        agregar_parrafo(doc, "No se ha generado una interpretación cualitativa.")
-
-    # ============================
-    # 2. DETALLE DE CRITERIOS C1 – C13
-    # ============================
-    doc.add_page_break()
-    agregar_titulo(doc, "2. DETALLE DE CRITERIOS C1 – C13", size=14)
-    agregar_parrafo(
-        doc,
-        "Se detallan los puntajes asignados a cada criterio de coherencia indiciaria "
-        "(C1, C2, ..., C13). Cuando alguno no aparezca, se debe a que el sistema no "
-        "pudo detectarlo en el texto analizado.",
-    )
-    agregar_parrafo(doc, "")
-    agregar_tabla_criterios(doc, criterios)
-
-    # ============================
-    # 3. INCONGRUENCIAS DETECTADAS
-    # ============================
-    doc.add_page_break()
-    agregar_titulo(doc, "3. INCONGRUENCIAS DETECTADAS", size=14)
-    agregar_parrafo(
-        doc,
-        "Se listan las principales incongruencias lógicas, tensiones probatorias o "
-        "saltos argumentativos detectados por el módulo de análisis de incongruencias "
-        "(Reglas 0–9). Cada ítem incluye los párrafos afectados y extractos relevantes.",
-    )
-    agregar_parrafo(doc, "")
-    agregar_incongruencias(doc, incong)
-
-    # ============================
-    # 4. NOTAS METODOLÓGICAS
-    # ============================
-    doc.add_page_break()
-    agregar_titulo(doc, "4. NOTAS METODOLÓGICAS", size=14)
-    agregar_parrafo(
-        doc,
-        "El sistema ACRJ–ICI V7 evalúa la coherencia indiciaria de las resoluciones "
-        "mediante reglas heurísticas y patrones lingüísticos inspirados en el método "
-        "indiciario (pluralidad de indicios, fiabilidad, nexo lógico, hipótesis "
-        "alternativas, coherencia interna y externa, ausencia de circularidad, etc.).",
-    )
-    agregar_parrafo(
-        doc,
-        "El resultado NO sustituye el juicio crítico del abogado defensor ni del tribunal, "
-        "sino que ofrece un mapa de riesgos argumentativos para orientar la revisión humana. "
-        "Debe interpretarse siempre como una herramienta de apoyo, no como una decisión "
-        "automática sobre culpabilidad o inocencia.",
-    )
-    agregar_parrafo(
-        doc,
-        "Se recomienda revisar especialmente los criterios con puntajes bajos (por debajo de 60), "
-        "así como las incongruencias lógicas, saltos probatorios y contradicciones internas "
-        "identificadas por el sistema, a fin de fundamentar recursos de nulidad, apelación o "
-        "acciones extraordinarias (revisión, habeas corpus, etc.) cuando corresponda.",
-    )
-
-    # GENERAR BYTES DEL DOCUMENTO PARA STREAMLIT
-    buffer = BytesIO()
-    doc.save(buffer)
-    buffer.seek(0)
-    return buffer.getvalue()
+import zipfile
+from dataclasses import asdict, is_dataclass
+from io import BytesIO
+from typing import Any, Dict, List
+from xml.sax.saxutils import escape
+
+
+# ============================
+# PLANTILLAS ESTÁTICAS DEL PAQUETE DOCX
+# ============================
+# Un .docx es un ZIP de XML. El informe es un ensamblado lineal de
+# párrafos y una tabla, así que se escribe el paquete directamente:
+# las partes fijas van como constantes y word/document.xml se arma
+# concatenando fragmentos <w:p>/<w:tbl>. Se evita construir el árbol
+# de objetos de python-docx, que dominaba tiempo y memoria en informes
+# grandes.
+
+_NS_W = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '<Override PartName="/word/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>'
+    "</Types>"
+)
+
+_RELS_PAQUETE = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>'
+    "</Relationships>"
+)
+
+_RELS_DOCUMENTO = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+    "</Relationships>"
+)
+
+# Estilos mínimos: Normal, la cuadrícula "Table Grid" que usa la tabla
+# de criterios e IncongrItem, que cierra cada incongruencia con 12 pt
+# de espaciado posterior (240 veinteavos de punto) en lugar de un
+# párrafo vacío por ítem.
+_ESTILOS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    f'<w:styles xmlns:w="{_NS_W}">'
+    '<w:style w:type="paragraph" w:default="1" w:styleId="Normal">'
+    '<w:name w:val="Normal"/>'
+    "</w:style>"
+    '<w:style w:type="table" w:default="1" w:styleId="TableNormal">'
+    '<w:name w:val="Normal Table"/>'
+    "</w:style>"
+    '<w:style w:type="paragraph" w:styleId="IncongrItem">'
+    '<w:name w:val="IncongrItem"/><w:basedOn w:val="Normal"/>'
+    '<w:pPr><w:spacing w:after="240"/></w:pPr>'
+    "</w:style>"
+    '<w:style w:type="table" w:styleId="TableGrid">'
+    '<w:name w:val="Table Grid"/><w:basedOn w:val="TableNormal"/>'
+    "<w:tblPr><w:tblBorders>"
+    '<w:top w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
+    '<w:left w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
+    '<w:bottom w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
+    '<w:right w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
+    '<w:insideH w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
+    '<w:insideV w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
+    "</w:tblBorders></w:tblPr>"
+    "</w:style>"
+    "</w:styles>"
+)
+
+_DOCUMENTO = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    f'<w:document xmlns:w="{_NS_W}"><w:body>{{cuerpo}}'
+    '<w:sectPr><w:pgSz w:w="12240" w:h="15840"/>'
+    '<w:pgMar w:top="1440" w:right="1440" w:bottom="1440" w:left="1440" '
+    'w:header="720" w:footer="720" w:gutter="0"/>'
+    "</w:sectPr></w:body></w:document>"
+)
+
+_SALTO_PAGINA = '<w:p><w:r><w:br w:type="page"/></w:r></w:p>'
+
+
+# ============================
+# UTILIDADES DE FORMATO
+# ============================
+
+def _xml_parrafo(texto: str, size: int = 11, bold: Any = False,
+                 estilo: str = None) -> str:
+    """
+    Devuelve el XML de un párrafo con un único run (bold True/False
+    explícito; bold None omite el elemento w:b). Con 'estilo' el párrafo
+    referencia un estilo de _ESTILOS (p. ej. IncongrItem).
+    """
+    if bold is None:
+        negrita = ""
+    elif bold:
+        negrita = "<w:b/>"
+    else:
+        negrita = '<w:b w:val="0"/>'
+    ppr = f'<w:pPr><w:pStyle w:val="{estilo}"/></w:pPr>' if estilo else ""
+    medios = size * 2  # w:sz se expresa en medios puntos
+    texto_xml = f"<w:t>{escape(texto)}</w:t>" if texto else ""
+    return (
+        f"<w:p>{ppr}<w:r><w:rPr>{negrita}"
+        f'<w:sz w:val="{medios}"/></w:rPr>'
+        f"{texto_xml}</w:r></w:p>"
+    )
+
+
+def agregar_titulo(partes: List[str], texto: str, size: int = 16, bold: bool = True):
+    """
+    Agrega un título o subtítulo al documento, con tamaño y negrita configurables.
+    """
+    partes.append(_xml_parrafo(texto, size=size, bold=bold))
+
+
+def agregar_parrafo(partes: List[str], texto: str, size: int = 11, bold: bool = False):
+    """
+    Agrega un párrafo estándar al documento.
+    """
+    partes.append(_xml_parrafo(texto, size=size, bold=bold))
+
+
+def _xml_celda(texto: str) -> str:
+    texto_xml = f"<w:t>{escape(texto)}</w:t>" if texto else ""
+    return f"<w:tc><w:tcPr/><w:p><w:r>{texto_xml}</w:r></w:p></w:tc>"
+
+
+def _clave_criterio(k: str):
+    """
+    Clave de orden natural para criterios tipo "C13": por letra y luego
+    por el número, para que C2 preceda a C10.
+    """
+    return (k[:1], int(k[1:]) if k[1:].isdigit() else 0, k)
+
+
+def agregar_tabla_criterios(partes: List[str], criterios: Dict[str, Any]):
+    """
+    Agrega una tabla con los criterios (C1, C2, ..., C13) y sus puntajes.
+    """
+    if not criterios:
+        agregar_parrafo(partes, "No se encontraron criterios evaluados.")
+        return
+
+    filas = [
+        "<w:tr>" + _xml_celda("Criterio") + _xml_celda("Puntaje") + "</w:tr>"
+    ]
+    # Ordenamos los criterios por número (C1, C2, ..., C13): el orden
+    # lexicográfico colocaba C10-C13 antes que C2.
+    filas.extend(
+        "<w:tr>" + _xml_celda(str(k)) + _xml_celda(str(criterios[k])) + "</w:tr>"
+        for k in sorted(criterios, key=_clave_criterio)
+    )
+
+    partes.append(
+        '<w:tbl><w:tblPr><w:tblStyle w:val="TableGrid"/>'
+        '<w:tblW w:w="0" w:type="auto"/></w:tblPr>'
+        "<w:tblGrid><w:gridCol/><w:gridCol/></w:tblGrid>"
+        + "".join(filas) + "</w:tbl>"
+    )
+    # Un párrafo vacío tras la tabla: dos tablas o una tabla y un salto
+    # de página contiguos sin párrafo intermedio confunden a Word.
+    partes.append(_xml_parrafo(""))
+
+
+def agregar_incongruencias(partes: List[str], incong: Any):
+    """
+    Agrega al informe la sección de incongruencias detectadas.
+
+    - Si 'incong' es:
+      * None o lista vacía → indica que no se detectaron.
+      * List[Incongruencia] / List[dict] → formato estructurado del
+        módulo incongruencias.py (actual e histórico, respectivamente).
+      * str / dict genérico → se imprime tal cual, como respaldo.
+    """
+    if not incong:
+        agregar_parrafo(partes, "No se registraron incongruencias detectadas.")
+        return
+
+    # Caso 1: lista estructurada proveniente de analizar_incongruencias()
+    if isinstance(incong, list) and incong and (
+        is_dataclass(incong[0]) or isinstance(incong[0], dict)
+    ):
+        for i, item in enumerate(incong, 1):
+            if is_dataclass(item):
+                item = asdict(item)
+            tipo = item.get("tipo", "Incongruencia sin tipo especificado")
+            parrafos = item.get("parrafos", [])
+            detalle = item.get("detalle", "")
+            extractos: List[str] = item.get("extractos", [])
+
+            # Líneas del ítem: encabezado numerado, párrafos afectados,
+            # detalle y extractos. Se reúnen primero porque la última
+            # lleva el estilo IncongrItem, cuyo espaciado posterior
+            # separa las incongruencias sin el párrafo vacío que antes
+            # se insertaba por ítem.
+            lineas = [(f"{i}. {tipo}", 11, True)]
+
+            if parrafos:
+                parrafos_str = ", ".join(str(n) for n in parrafos)
+                lineas.append((f"Párrafos involucrados: {parrafos_str}", 11, False))
+
+            if detalle:
+                lineas.append((f"Detalle: {detalle}", 11, False))
+
+            if extractos:
+                lineas.append(("Extractos relevantes:", 11, True))
+                lineas.extend((f"- {ex}", 10, None) for ex in extractos)
+
+            partes.extend(
+                _xml_parrafo(t, size=s, bold=b) for t, s, b in lineas[:-1]
+            )
+            t, s, b = lineas[-1]
+            partes.append(_xml_parrafo(t, size=s, bold=b, estilo="IncongrItem"))
+        return
+
+    # Caso 2: si solo es un string (respaldo)
+    if isinstance(incong, str):
+        agregar_parrafo(partes, incong)
+        return
+
+    # Caso 3: si es un dict genérico
+    if isinstance(incong, dict):
+        for k, v in incong.items():
+            agregar_parrafo(partes, f"- {k}: {v}")
+        return
+
+    # Caso 4: cualquier otro tipo → lo imprimimos en bruto
+    agregar_parrafo(partes, str(incong))
+
+
+# ============================
+# FUNCIÓN PRINCIPAL
+# ============================
+
+def generar_informe(texto: str, resultados: Dict[str, Any], incong: Any) -> BytesIO:
+    """
+    Genera un informe en formato .docx (devuelto como BytesIO) a partir de:
+
+    - texto: sentencia analizada (por ahora solo se usa para contexto futuro).
+    - resultados: dict devuelto por el evaluador (criterios, ICI, interpretación).
+    - incong: lista de incongruencias devuelta por analizar_incongruencias().
+
+    Retorna: buffer listo para usar en st.download_button en Streamlit
+    (acepta objetos tipo archivo). Devolver el buffer evita la segunda
+    copia completa del documento que hacía getvalue(); si algún
+    consumidor necesita bytes, puede usar bytes(buffer.getbuffer())
+    sin copia intermedia adicional.
+    """
+    partes: List[str] = []
+
+    # ============================
+    # PORTADA
+    # ============================
+    agregar_titulo(partes, "INFORME DE COHERENCIA INDICIARIA – ICI V7", size=18)
+    agregar_parrafo(partes, "Sistema de Auditoría Indiciaria ACRJ – Versión 7.")
+    agregar_parrafo(partes, "")
+    agregar_parrafo(
+        partes,
+        "Este informe resume el análisis automatizado realizado sobre la resolución o sentencia "
+        "cargada, aplicando criterios de coherencia indiciaria y reglas de detección de "
+        "incongruencias lógicas y normativas.",
+    )
+    partes.append(_SALTO_PAGINA)
+
+    # ============================
+    # 1. RESUMEN ICI
+    # ============================
+    agregar_titulo(partes, "1. RESUMEN DEL ÍNDICE DE COHERENCIA INDICIARIA", size=14)
+
+    # Extraer datos del dict de resultados
+    criterios = resultados.get("criterios", {}) if isinstance(resultados, dict) else {}
+    ici_sin = resultados.get("ICI_sin_penalizacion", None) if isinstance(resultados, dict) else None
+    ici_aj = resultados.get("ICI_ajustado", None) if isinstance(resultados, dict) else None
+    interpretacion = resultados.get("interpretacion", "") if isinstance(resultados, dict) else ""
+
+    if ici_sin is not None:
+        agregar_parrafo(partes, f"ICI sin penalización: {ici_sin}", bold=True)
+    if ici_aj is not None:
+        agregar_parrafo(partes, f"ICI ajustado (con frenos de emergencia): {ici_aj}", bold=True)
+
+    agregar_parrafo(partes, "")
+    agregar_parrafo(partes, "Interpretación cualitativa:", bold=True)
+    if interpretacion:
+        agregar_parrafo(partes, interpretacion)
+    else:
+        agregar_parrafo(partes, "No se ha generado una interpretación cualitativa.")
+
+    # ============================
+    # 2. DETALLE DE CRITERIOS C1 – C13
+    # ============================
+    partes.append(_SALTO_PAGINA)
+    agregar_titulo(partes, "2. DETALLE DE CRITERIOS C1 – C13", size=14)
+    agregar_parrafo(
+        partes,
+        "Se detallan los puntajes asignados a cada criterio de coherencia indiciaria "
+        "(C1, C2, ..., C13). Cuando alguno no aparezca, se debe a que el sistema no "
+        "pudo detectarlo en el texto analizado.",
+    )
+    agregar_parrafo(partes, "")
+    agregar_tabla_criterios(partes, criterios)
+
+    # ============================
+    # 3. INCONGRUENCIAS DETECTADAS
+    # ============================
+    partes.append(_SALTO_PAGINA)
+    agregar_titulo(partes, "3. INCONGRUENCIAS DETECTADAS", size=14)
+    agregar_parrafo(
+        partes,
+        "Se listan las principales incongruencias lógicas, tensiones probatorias o "
+        "saltos argumentativos detectados por el módulo de análisis de incongruencias "
+        "(Reglas 0–9). Cada ítem incluye los párrafos afectados y extractos relevantes.",
+    )
+    agregar_parrafo(partes, "")
+    agregar_incongruencias(partes, incong)
+
+    # ============================
+    # 4. NOTAS METODOLÓGICAS
+    # ============================
+    partes.append(_SALTO_PAGINA)
+    agregar_titulo(partes, "4. NOTAS METODOLÓGICAS", size=14)
+    agregar_parrafo(
+        partes,
+        "El sistema ACRJ–ICI V7 evalúa la coherencia indiciaria de las resoluciones "
+        "mediante reglas heurísticas y patrones lingüísticos inspirados en el método "
+        "indiciario (pluralidad de indicios, fiabilidad, nexo lógico, hipótesis "
+        "alternativas, coherencia interna y externa, ausencia de circularidad, etc.).",
+    )
+    agregar_parrafo(
+        partes,
+        "El resultado NO sustituye el juicio crítico del abogado defensor ni del tribunal, "
+        "sino que ofrece un mapa de riesgos argumentativos para orientar la revisión humana. "
+        "Debe interpretarse siempre como una herramienta de apoyo, no como una decisión "
+        "automática sobre culpabilidad o inocencia.",
+    )
+    agregar_parrafo(
+        partes,
+        "Se recomienda revisar especialmente los criterios con puntajes bajos (por debajo de 60), "
+        "así como las incongruencias lógicas, saltos probatorios y contradicciones internas "
+        "identificadas por el sistema, a fin de fundamentar recursos de nulidad, apelación o "
+        "acciones extraordinarias (revisión, habeas corpus, etc.) cuando corresponda.",
+    )
+
+    # ============================
+    # EMPAQUETADO DEL ZIP PARA STREAMLIT
+    # ============================
+    documento = _DOCUMENTO.format(cuerpo="".join(partes))
+
+    # Nivel 1 de DEFLATE: el informe se comprime una vez y se descarga
+    # al instante; el nivel por omisión (6) tarda varias veces más para
+    # ganar poco tamaño en un paquete que ya es puro texto corto.
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        zf.writestr("[Content_Types].xml", _CONTENT_TYPES)
+        zf.writestr("_rels/.rels", _RELS_PAQUETE)
+        zf.writestr("word/_rels/document.xml.rels", _RELS_DOCUMENTO)
+        zf.writestr("word/styles.xml", _ESTILOS)
+        zf.writestr("word/document.xml", documento)
+    buffer.seek(0)
+    return buffer